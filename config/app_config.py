@@ -2,9 +2,32 @@
 应用程序配置管理模块
 """
 from typing import Dict, Any
+import functools
 import json
 import os
 
+
+@functools.lru_cache(maxsize=4096)
+def _format_timeout(timeout_seconds: int) -> str:
+    """格式化超时时间（纯函数，按秒数缓存）"""
+    if timeout_seconds < 60:
+        return f"{timeout_seconds}秒"
+    elif timeout_seconds < 3600:
+        minutes = timeout_seconds // 60
+        seconds = timeout_seconds % 60
+        if seconds == 0:
+            return f"{minutes}分钟"
+        else:
+            return f"{minutes}分{seconds}秒"
+    else:
+        hours = timeout_seconds // 3600
+        minutes = (timeout_seconds % 3600) // 60
+        if minutes == 0:
+            return f"{hours}小时"
+        else:
+            return f"{hours}小时{minutes}分钟"
+
+
 class AppConfig:
     """应用程序配置管理类"""
     
@@ -84,6 +107,16 @@ class AppConfig:
             timeout_seconds = 7200
         self.set("package_timeout", timeout_seconds)
 
+    # 文件对话框相关的便捷方法
+    def get_last_dir(self, purpose: str) -> str:
+        """获取某类文件对话框上次使用的目录"""
+        return self.get(f"last_dir_{purpose}", "")
+
+    def set_last_dir(self, purpose: str, directory: str) -> None:
+        """记录某类文件对话框本次使用的目录"""
+        if directory:
+            self.set(f"last_dir_{purpose}", directory)
+
     def get_timeout_presets(self) -> Dict[str, int]:
         """获取超时时间预设选项"""
         return {
@@ -97,22 +130,7 @@ class AppConfig:
 
     def format_timeout_display(self, timeout_seconds: int) -> str:
         """格式化超时时间显示"""
-        if timeout_seconds < 60:
-            return f"{timeout_seconds}秒"
-        elif timeout_seconds < 3600:
-            minutes = timeout_seconds // 60
-            seconds = timeout_seconds % 60
-            if seconds == 0:
-                return f"{minutes}分钟"
-            else:
-                return f"{minutes}分{seconds}秒"
-        else:
-            hours = timeout_seconds // 3600
-            minutes = (timeout_seconds % 3600) // 60
-            if minutes == 0:
-                return f"{hours}小时"
-            else:
-                return f"{hours}小时{minutes}分钟"
+        return _format_timeout(timeout_seconds)
 
     def suggest_timeout_for_project(self, script_path: str = None) -> int:
         """根据项目特征智能建议超时时间"""
@@ -2,7 +2,7 @@
 主控制器
 """
 from typing import Optional
-from PyQt5.QtCore import QObject, pyqtSlot
+from PyQt5.QtCore import QObject, QProcess, pyqtSlot
 from PyQt5.QtWidgets import QMessageBox
 
 from config.app_config import AppConfig
@@ -38,6 +38,11 @@ class MainController(QObject):
         python_interpreter = self.config.get("python_interpreter", "")
         return PyInstallerChecker.check_pyinstaller(python_interpreter)
 
+    def create_pyinstaller_check_process(self, parent: Optional[QObject] = None) -> QProcess:
+        """创建检查PyInstaller安装状态的QProcess（未启动），结果由调用方异步处理"""
+        python_interpreter = self.config.get("python_interpreter", "")
+        return PyInstallerChecker.create_check_process(python_interpreter, parent)
+
     def install_pyinstaller(self, output_callback=None) -> bool:
         """安装PyInstaller"""
         python_interpreter = self.config.get("python_interpreter", "")
@@ -1,11 +1,24 @@
 """
 PyInstaller打包模型
 """
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
+import functools
 import os
 import sys
 from config.app_config import AppConfig
 
+# 关键DLL扫描结果缓存（按sys.prefix区分，会话内目录结构不变）
+_critical_binaries_cache: Dict[str, List[str]] = {}
+
+
+@functools.lru_cache(maxsize=32)
+def _smart_args_for(script_path: str, mtime: float) -> Tuple[str, ...]:
+    """按(脚本路径, 修改时间)缓存智能检测生成的参数，脚本未修改时不重复分析"""
+    from services.module_detector import ModuleDetector
+    detector = ModuleDetector(use_ast=True, use_pyinstaller=False)
+    return tuple(detector.generate_pyinstaller_args(script_path))
+
+
 class PyInstallerModel:
     """PyInstaller打包配置模型"""
     
@@ -127,11 +140,13 @@ class PyInstallerModel:
             cmd.append(f"--add-binary={binary_path}")
 
         # 智能检测并添加脚本特定的隐藏导入
-        if self.script_path and os.path.exists(self.script_path):
+        try:
+            script_mtime = os.stat(self.script_path).st_mtime if self.script_path else None
+        except OSError:
+            script_mtime = None
+        if script_mtime is not None:
             try:
-                from services.module_detector import ModuleDetector
-                detector = ModuleDetector(use_ast=True, use_pyinstaller=False)
-                smart_args = detector.generate_pyinstaller_args(self.script_path)
+                smart_args = _smart_args_for(self.script_path, script_mtime)
 
                 # 过滤掉已经存在的参数，避免重复
                 existing_args = set(cmd)
@@ -306,8 +321,9 @@ coll = COLLECT(
 
     def _get_critical_binaries(self) -> List[str]:
         """获取关键的二进制文件（DLL）路径"""
-        import sys
-        import os
+        cached = _critical_binaries_cache.get(sys.prefix)
+        if cached is not None:
+            return list(cached)
 
         critical_binaries = []
 
@@ -341,7 +357,8 @@ coll = COLLECT(
                             # 格式：源路径;目标路径
                             critical_binaries.append(f"{dll_path};.")
 
-        return critical_binaries
+        _critical_binaries_cache[sys.prefix] = critical_binaries
+        return list(critical_binaries)
 
     def to_dict(self) -> dict:
         """转换为字典格式"""
@@ -376,6 +393,18 @@ coll = COLLECT(
             "splash": self.splash,
         }
     
+    def config_fingerprint(self) -> tuple:
+        """生成命令所依赖的配置快照（列表转为元组，用于判断配置是否变化）"""
+        fields = tuple(
+            (key, tuple(value) if isinstance(value, list) else value)
+            for key, value in self.to_dict().items()
+        )
+        return fields + (
+            tuple(self.smart_hidden_imports),
+            tuple(self.smart_collect_all),
+            tuple(self.smart_data_files),
+        )
+
     def from_dict(self, data: dict) -> None:
         """从字典加载配置"""
         for key, value in data.items():
@@ -5,15 +5,43 @@ import subprocess
 import sys
 import os
 import time
-import threading
+import locale
+import traceback
 from typing import Optional, Callable
-from PyQt5.QtCore import QThread, pyqtSignal, QTimer
+from PyQt5.QtCore import Qt, QObject, QThread, pyqtSignal, pyqtSlot, QTimer, QProcess
 from models.packer_model import PyInstallerModel
 from utils.logger import log_info, log_error, log_warning, report_error
 from utils.exceptions import PackageError, handle_exception_with_dialog
 
-class AsyncPackageWorker(QThread):
-    """异步打包工作线程"""
+class _PackagePrepareThread(QThread):
+    """在后台线程中验证配置并生成打包命令（可能涉及模块检测，耗时较长）"""
+
+    def __init__(self, model: PyInstallerModel, python_interpreter: str = "", parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self.model = model
+        self.python_interpreter = python_interpreter
+        self.errors = []
+        self.command = ""
+        self.exception: Optional[Exception] = None
+        self.stack_trace = ""
+
+    def run(self) -> None:
+        """验证配置，通过后生成打包命令"""
+        try:
+            self.errors = self.model.validate_config()
+            if not self.errors:
+                self.command = self.model.generate_command(self.python_interpreter)
+        except Exception as e:
+            self.exception = e
+            self.stack_trace = traceback.format_exc()
+
+
+class AsyncPackageWorker(QObject):
+    """异步打包工作者
+
+    配置验证和命令生成在后台线程中完成，PyInstaller 子进程由 QProcess 驱动，
+    输出、结束和超时都通过事件循环信号处理。
+    """
 
     # 信号定义
     progress_updated = pyqtSignal(int)  # 进度更新
@@ -23,174 +51,256 @@ class AsyncPackageWorker(QThread):
     status_changed = pyqtSignal(str)    # 状态变化信号
     remaining_time_updated = pyqtSignal(int)  # 剩余时间更新（秒）
     timeout_warning = pyqtSignal(int)  # 超时警告（剩余秒数）
+    finished = pyqtSignal()  # 任务结束（与 QThread.finished 保持一致）
 
-    def __init__(self, model: PyInstallerModel, python_interpreter: str = "", timeout: int = None):
-        super().__init__()
+    def __init__(self, model: PyInstallerModel, python_interpreter: str = "", timeout: int = None,
+                 parent: Optional[QObject] = None):
+        super().__init__(parent)
         self.model = model
         self.python_interpreter = python_interpreter
         # 如果没有指定超时时间，从配置中获取
         self.timeout = timeout if timeout is not None else model.config.get_package_timeout()
-        self.process: Optional[subprocess.Popen] = None
+        self.process: Optional[QProcess] = None
         self._cancelled = False
+        self._timed_out = False
+        self._running = False
+        self._prepare_thread: Optional[_PackagePrepareThread] = None
+        self._terminate_time = 0.0
         self.start_time = None
         self.remaining_time_timer = None
         self._start_time = 0
+        self._line_count = 0
+        self._last_heartbeat = 0.0
 
-    def run(self) -> None:
-        """执行打包任务"""
-        try:
-            self._start_time = time.time()
-            self.start_time = self._start_time  # 为剩余时间监控使用
+        # 每秒检查一次取消、超时和心跳
+        self._watchdog_timer = QTimer(self)
+        self._watchdog_timer.setInterval(1000)
+        self._watchdog_timer.timeout.connect(self._on_watchdog)
 
-            # 启动剩余时间监控
-            if self.model.config.get("timeout_show_remaining", True):
-                self._start_remaining_time_monitor()
+    def start(self) -> None:
+        """开始打包任务"""
+        if self._running:
+            return
+        self._running = True
+        self._cancelled = False
+        self._timed_out = False
+        self._terminate_time = 0.0
+        self._start_time = time.time()
+        self.start_time = self._start_time  # 为剩余时间监控使用
+
+        # 启动剩余时间监控
+        if self.model.config.get("timeout_show_remaining", True):
+            self._start_remaining_time_monitor()
+
+        self.status_changed.emit("准备打包...")
+        self.output_received.emit("=" * 50)
+        self.output_received.emit("开始异步打包过程...")
+        self.output_received.emit(f"超时设置: {self.model.config.format_timeout_display(self.timeout)}")
+        self.output_received.emit("=" * 50)
+        self.progress_updated.emit(5)
+
+        # 验证配置和生成命令放到后台线程，完成后回到本线程启动进程
+        self.output_received.emit("正在验证打包配置...")
+        self._prepare_thread = _PackagePrepareThread(self.model, self.python_interpreter, self)
+        self._prepare_thread.finished.connect(self._on_prepared)
+        self._prepare_thread.start()
+
+    def isRunning(self) -> bool:
+        """是否正在打包"""
+        return self._running
+
+    def wait(self, msecs: int = -1) -> bool:
+        """阻塞等待打包结束，仅供没有事件循环的线程使用"""
+        deadline = None if msecs < 0 else time.time() + msecs / 1000
+        # 没有事件循环时收不到准备线程的 finished 信号，直接等待并处理结果
+        if self._prepare_thread is not None:
+            self._prepare_thread.wait()
+            self._on_prepared()
+        while self._running and self.process is not None:
+            if not self.process.waitForFinished(200) and self.process.state() == QProcess.NotRunning:
+                break
+            self._on_watchdog()
+            if deadline is not None and time.time() >= deadline:
+                break
+        return not self._running
+
+    @pyqtSlot()
+    def _on_prepared(self) -> None:
+        """配置验证和命令生成完成"""
+        thread = self._prepare_thread
+        if thread is None:
+            return
+        self._prepare_thread = None
+        thread.deleteLater()
 
-            self.status_changed.emit("准备打包...")
-            self.output_received.emit("=" * 50)
-            self.output_received.emit("开始异步打包过程...")
-            self.output_received.emit(f"超时设置: {self.model.config.format_timeout_display(self.timeout)}")
-            self.output_received.emit("=" * 50)
-            self.progress_updated.emit(5)
-
-            # 验证配置
-            self.output_received.emit("正在验证打包配置...")
-            errors = self.model.validate_config()
-            if errors:
-                error_msg = "配置验证失败:\n" + "\n".join(f"  - {error}" for error in errors)
-                self.error_occurred.emit(error_msg)
-                self.finished_signal.emit(False, "配置验证失败")
-                return
-
-            self.output_received.emit("✅ 配置验证通过")
-            self.progress_updated.emit(8)
-
-            # 生成打包命令
-            self.output_received.emit("正在生成打包命令...")
-            command = self.model.generate_command(self.python_interpreter)
-            if not command:
-                self.error_occurred.emit("无法生成打包命令")
-                self.finished_signal.emit(False, "无法生成打包命令")
-                return
-
-            self.output_received.emit("✅ 打包命令生成成功")
-            self.output_received.emit(f"命令: {command}")
-            self.progress_updated.emit(10)
-            self.status_changed.emit("正在执行打包...")
-
-            # 执行打包
-            self._execute_packaging(command)
+        if self._cancelled:
+            self.output_received.emit("⚠️ 用户请求取消打包...")
+            self._finish(False, "用户取消")
+            return
 
-        except Exception as e:
-            # 生成详细的错误报告
-            context = {
-                'script_path': self.model.script_path,
-                'output_dir': self.model.output_dir,
-                'python_interpreter': self.python_interpreter,
-                'timeout': self.timeout
-            }
-
-            report_id = report_error(
-                "PackageProcessError",
-                str(e),
-                context,
-                self._get_stack_trace()
-            )
+        if thread.exception is not None:
+            self._report_exception(thread.exception, thread.stack_trace)
+            return
 
-            error_msg = f"打包过程出错: {str(e)}"
+        if thread.errors:
+            error_msg = "配置验证失败:\n" + "\n".join(f"  - {error}" for error in thread.errors)
             self.error_occurred.emit(error_msg)
-            self.finished_signal.emit(False, str(e))
+            self._finish(False, "配置验证失败")
+            return
 
-            log_error(f"打包失败，错误报告ID: {report_id}")
-        finally:
-            # 停止剩余时间监控
-            self._stop_remaining_time_monitor()
+        self.output_received.emit("✅ 配置验证通过")
+        self.progress_updated.emit(8)
 
-    def _execute_packaging(self, command: str):
-        """执行打包命令"""
+        self.output_received.emit("正在生成打包命令...")
+        command = thread.command
+        if not command:
+            self.error_occurred.emit("无法生成打包命令")
+            self._finish(False, "无法生成打包命令")
+            return
+
+        self.output_received.emit("✅ 打包命令生成成功")
+        self.output_received.emit(f"命令: {command}")
+        self.progress_updated.emit(10)
+        self.status_changed.emit("正在执行打包...")
+
+        # 执行打包
         try:
-            # 设置工作目录
-            work_dir = os.path.dirname(self.model.script_path) if self.model.script_path else os.getcwd()
-            self.output_received.emit(f"工作目录: {work_dir}")
-            self.output_received.emit("正在启动PyInstaller进程...")
+            self._execute_packaging(command)
+        except Exception as e:
+            self._report_exception(e, traceback.format_exc())
+
+    def _report_exception(self, error: Exception, stack_trace: str) -> None:
+        """生成错误报告并结束打包"""
+        context = {
+            'script_path': self.model.script_path,
+            'output_dir': self.model.output_dir,
+            'python_interpreter': self.python_interpreter,
+            'timeout': self.timeout
+        }
 
-            # 启动进程
-            creationflags = subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
-            self.process = subprocess.Popen(
-                command,
-                shell=True,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                universal_newlines=True,
-                cwd=work_dir,
-                creationflags=creationflags,
-                bufsize=1  # 行缓冲，确保实时输出
-            )
+        report_id = report_error(
+            "PackageProcessError",
+            str(error),
+            context,
+            stack_trace
+        )
 
-            self.output_received.emit("✅ PyInstaller进程已启动")
-            self.output_received.emit("-" * 50)
-            self.progress_updated.emit(20)
-
-            # 启动超时监控
-            timeout_thread = threading.Thread(target=self._monitor_timeout)
-            timeout_thread.daemon = True
-            timeout_thread.start()
-
-            # 添加心跳计数器
-            line_count = 0
-            last_heartbeat = time.time()
-
-            # 实时读取输出
-            while True:
-                if self._cancelled:
-                    self.output_received.emit("⚠️ 用户请求取消打包...")
-                    self.process.terminate()
-                    self.status_changed.emit("正在取消...")
-                    self.finished_signal.emit(False, "用户取消")
-                    return
-
-                output = self.process.stdout.readline()
-                if output == '' and self.process.poll() is not None:
-                    break
-
-                if output:
-                    line_count += 1
-                    # 显示原始输出
-                    self.output_received.emit(output.strip())
-                    # 根据输出内容更新进度
-                    self._update_progress_from_output(output)
-                    last_heartbeat = time.time()
-                else:
-                    # 心跳机制 - 如果长时间没有输出，显示进度信息
-                    current_time = time.time()
-                    if current_time - last_heartbeat > 5:  # 5秒没有输出
-                        elapsed = current_time - self._start_time
-                        self.output_received.emit(f"⏱️ 打包进行中... 已用时 {elapsed:.1f}秒，处理了 {line_count} 行输出")
-                        last_heartbeat = current_time
-
-            # 显示最终统计
-            total_time = time.time() - self._start_time
-            self.output_received.emit("-" * 50)
-            self.output_received.emit(f"📊 打包统计: 总用时 {total_time:.1f}秒，处理了 {line_count} 行输出")
-
-            # 检查结果
-            return_code = self.process.poll()
-            if return_code == 0:
-                self.progress_updated.emit(100)
-                self.status_changed.emit("打包完成")
-                self.output_received.emit("🎉 打包成功完成！")
-                self.output_received.emit("=" * 50)
-                self.finished_signal.emit(True, "打包完成")
-            else:
-                self.error_occurred.emit(f"打包失败，退出码: {return_code}")
-                self.output_received.emit(f"❌ 打包失败，退出码: {return_code}")
-                self.output_received.emit("=" * 50)
-                self.finished_signal.emit(False, f"打包失败，退出码: {return_code}")
+        error_msg = f"打包过程出错: {str(error)}"
+        self.error_occurred.emit(error_msg)
+        self._finish(False, str(error))
 
-        except Exception as e:
-            self.error_occurred.emit(f"执行错误: {str(e)}")
-            self.output_received.emit(f"💥 执行异常: {str(e)}")
-            self.finished_signal.emit(False, f"执行错误: {str(e)}")
+        log_error(f"打包失败，错误报告ID: {report_id}")
+
+    def _execute_packaging(self, command: str):
+        """启动打包进程，后续输出和结束由信号驱动"""
+        # 设置工作目录
+        work_dir = os.path.dirname(self.model.script_path) if self.model.script_path else os.getcwd()
+        self.output_received.emit(f"工作目录: {work_dir}")
+        self.output_received.emit("正在启动PyInstaller进程...")
+
+        process = QProcess(self)
+        process.setWorkingDirectory(work_dir)
+        process.setProcessChannelMode(QProcess.MergedChannels)
+        process.readyReadStandardOutput.connect(self._on_ready_read)
+        process.finished.connect(self._on_process_finished)
+        process.errorOccurred.connect(self._on_process_error)
+        self.process = process
+
+        # 命令是拼接好的字符串，与原先 shell=True 一样交给系统 shell 解析
+        if sys.platform == "win32":
+            process.setProgram(os.environ.get("COMSPEC", "cmd.exe"))
+            process.setNativeArguments(f'/c "{command}"')
+        else:
+            process.setProgram("/bin/sh")
+            process.setArguments(["-c", command])
+
+        self._line_count = 0
+        self._last_heartbeat = time.time()
+        process.start()
+
+        self.output_received.emit("✅ PyInstaller进程已启动")
+        self.output_received.emit("-" * 50)
+        self.progress_updated.emit(20)
+
+        # 启动超时监控
+        self._watchdog_timer.start()
+
+    def _decode(self, data) -> str:
+        """把进程输出解码为文本"""
+        return bytes(data).decode(locale.getpreferredencoding(False), errors="replace")
+
+    def _handle_output_line(self, output: str):
+        """处理一行进程输出"""
+        self._line_count += 1
+        # 显示原始输出
+        self.output_received.emit(output.strip())
+        # 根据输出内容更新进度
+        self._update_progress_from_output(output)
+        self._last_heartbeat = time.time()
+
+    def _on_ready_read(self):
+        """读取进程已输出的完整行"""
+        process = self.process
+        if process is None:
+            return
+        while process.canReadLine():
+            self._handle_output_line(self._decode(process.readLine()))
+
+    def _on_process_finished(self, exit_code: int, exit_status):
+        """打包进程结束"""
+        self._watchdog_timer.stop()
+        # 读取最后一段没有换行结尾的输出
+        rest = self._decode(self.process.readAll()) if self.process else ""
+        for line in rest.splitlines():
+            self._handle_output_line(line)
+
+        if self._cancelled:
+            self.output_received.emit("⚠️ 用户请求取消打包...")
+            self.status_changed.emit("正在取消...")
+            self._finish(False, "用户取消")
+            return
+        if self._timed_out:
+            self._finish(False, f"打包超时 ({self.timeout}秒)")
+            return
+
+        # 显示最终统计
+        total_time = time.time() - self._start_time
+        self.output_received.emit("-" * 50)
+        self.output_received.emit(f"📊 打包统计: 总用时 {total_time:.1f}秒，处理了 {self._line_count} 行输出")
+
+        # 检查结果
+        return_code = exit_code if exit_status == QProcess.NormalExit else -1
+        if return_code == 0:
+            self.progress_updated.emit(100)
+            self.status_changed.emit("打包完成")
+            self.output_received.emit("🎉 打包成功完成！")
+            self.output_received.emit("=" * 50)
+            self._finish(True, "打包完成")
+        else:
+            self.error_occurred.emit(f"打包失败，退出码: {return_code}")
+            self.output_received.emit(f"❌ 打包失败，退出码: {return_code}")
+            self.output_received.emit("=" * 50)
+            self._finish(False, f"打包失败，退出码: {return_code}")
+
+    def _on_process_error(self, error):
+        """进程启动失败（其他错误会随后触发 finished）"""
+        if error != QProcess.FailedToStart:
+            return
+        self._watchdog_timer.stop()
+        message = self.process.errorString() if self.process else ""
+        self.error_occurred.emit(f"执行错误: {message}")
+        self.output_received.emit(f"💥 执行异常: {message}")
+        self._finish(False, f"执行错误: {message}")
+
+    def _finish(self, success: bool, message: str):
+        """发出完成信号，只发一次"""
+        if not self._running:
+            return
+        self._running = False
+        self._watchdog_timer.stop()
+        self._stop_remaining_time_monitor()
+        self.finished_signal.emit(success, message)
+        self.finished.emit()
 
     def _update_progress_from_output(self, output: str):
         """根据输出内容更新进度"""
@@ -234,33 +344,60 @@ class AsyncPackageWorker(QThread):
             # 错误信息，添加特殊标记
             self.output_received.emit(f"❌ {output.strip()}")
 
-    def _monitor_timeout(self):
-        """监控超时"""
-        while not self._cancelled and self.process and self.process.poll() is None:
-            elapsed = time.time() - self._start_time
-            if elapsed > self.timeout:
-                self.error_occurred.emit(f"打包超时 ({self.timeout}秒)")
-                if self.process:
-                    self.process.terminate()
-                self.finished_signal.emit(False, f"打包超时 ({self.timeout}秒)")
-                return
-            time.sleep(1)
+    def _on_watchdog(self):
+        """在进程所属线程中处理取消和超时，长时间没有输出时显示心跳信息"""
+        if not self._running or self.process is None:
+            return
+        current_time = time.time()
 
-    def cancel(self) -> None:
-        """取消打包"""
-        self._cancelled = True
-        if self.process:
+        # 已请求结束的进程3秒内未退出则强制结束
+        if self._terminate_time:
+            if current_time - self._terminate_time > 3:
+                self._kill_process()
+            return
+
+        # 其他线程请求的取消在这里执行
+        if self._cancelled:
+            self._terminate_process()
+            return
+
+        elapsed = current_time - self._start_time
+        if elapsed > self.timeout:
+            self._timed_out = True
+            self.error_occurred.emit(f"打包超时 ({self.timeout}秒)")
+            self._terminate_process()
+            return
+
+        # 心跳机制 - 如果长时间没有输出，显示进度信息
+        if current_time - self._last_heartbeat > 5:  # 5秒没有输出
+            self.output_received.emit(f"⏱️ 打包进行中... 已用时 {elapsed:.1f}秒，处理了 {self._line_count} 行输出")
+            self._last_heartbeat = current_time
+
+    def _terminate_process(self):
+        """请求结束进程，由看门狗在超时后强制结束"""
+        if self.process and self.process.state() != QProcess.NotRunning:
             self.process.terminate()
+            self._terminate_time = time.time()
+
+    def _kill_process(self):
+        """强制结束进程"""
+        if self.process and self.process.state() != QProcess.NotRunning:
+            self.process.kill()
+
+    def cancel(self) -> None:
+        """取消打包
 
-    def _get_stack_trace(self) -> str:
-        """获取当前堆栈跟踪"""
-        import traceback
-        return traceback.format_exc()
+        QProcess 只能在所属线程中操作：在所属线程调用时立即结束进程，
+        否则只做标记，由所属线程的看门狗执行。
+        """
+        self._cancelled = True
+        if self.process and QThread.currentThread() is self.thread():
+            self._terminate_process()
 
     def _start_remaining_time_monitor(self):
         """启动剩余时间监控"""
         if self.remaining_time_timer is None:
-            self.remaining_time_timer = QTimer()
+            self.remaining_time_timer = QTimer(self)
             self.remaining_time_timer.timeout.connect(self._update_remaining_time)
             self.remaining_time_timer.start(5000)  # 每5秒更新一次
 
@@ -318,9 +455,9 @@ class PackageService(QThread):
             self.worker.progress_updated.connect(self.progress_signal.emit)
             self.worker.error_occurred.connect(lambda msg: self.output_signal.emit(f"[ERROR] {msg}"))
 
-            # 启动工作线程并等待完成
+            # 本线程没有事件循环，启动后由 wait() 驱动进程输出直到结束
             self.worker.start()
-            self.worker.wait()  # 等待工作线程完成
+            self.worker.wait()
 
         except Exception as e:
             self.finished_signal.emit(False, f"打包服务错误: {str(e)}")
@@ -356,13 +493,13 @@ class AsyncPackageService:
             return False  # 已有任务在运行
 
         try:
-            # 创建工作线程
+            # 创建打包工作者
             self.worker = AsyncPackageWorker(self.model, self.python_interpreter, self.timeout)
 
             # 立即连接信号
             self._connect_worker_signals()
 
-            # 启动工作线程
+            # 启动打包进程
             self.worker.start()
             return True
         except Exception as e:
@@ -400,20 +537,22 @@ class AsyncPackageService:
         if not self.worker:
             return
 
+        # 使用队列连接，回调在事件循环中执行，不会在进程信号处理中途重入界面代码
+
         if self._callbacks['progress']:
-            self.worker.progress_updated.connect(self._callbacks['progress'])
+            self.worker.progress_updated.connect(self._callbacks['progress'], Qt.QueuedConnection)
         if self._callbacks['output']:
-            self.worker.output_received.connect(self._callbacks['output'])
+            self.worker.output_received.connect(self._callbacks['output'], Qt.QueuedConnection)
         if self._callbacks['error']:
-            self.worker.error_occurred.connect(self._callbacks['error'])
+            self.worker.error_occurred.connect(self._callbacks['error'], Qt.QueuedConnection)
         if self._callbacks['finished']:
-            self.worker.finished_signal.connect(self._callbacks['finished'])
+            self.worker.finished_signal.connect(self._callbacks['finished'], Qt.QueuedConnection)
         if self._callbacks['status']:
-            self.worker.status_changed.connect(self._callbacks['status'])
+            self.worker.status_changed.connect(self._callbacks['status'], Qt.QueuedConnection)
         if self._callbacks['remaining_time']:
-            self.worker.remaining_time_updated.connect(self._callbacks['remaining_time'])
+            self.worker.remaining_time_updated.connect(self._callbacks['remaining_time'], Qt.QueuedConnection)
         if self._callbacks['timeout_warning']:
-            self.worker.timeout_warning.connect(self._callbacks['timeout_warning'])
+            self.worker.timeout_warning.connect(self._callbacks['timeout_warning'], Qt.QueuedConnection)
 
 
 class PyInstallerChecker:
@@ -434,6 +573,17 @@ class PyInstallerChecker:
         except Exception:
             return False
     
+    @staticmethod
+    def create_check_process(python_interpreter: str = "", parent=None) -> QProcess:
+        """创建检查PyInstaller的QProcess（未启动），用于不阻塞界面的检查
+
+        进程正常退出且退出码为0表示已安装
+        """
+        process = QProcess(parent)
+        process.setProgram(python_interpreter or sys.executable)
+        process.setArguments(["-m", "PyInstaller", "--version"])
+        return process
+
     @staticmethod
     def install_pyinstaller(output_callback: Optional[Callable[[str], None]] = None, python_interpreter: str = "") -> bool:
         """安装PyInstaller"""
@@ -461,4 +611,26 @@ class PyInstallerChecker:
         except Exception as e:
             if output_callback:
                 output_callback(f"安装失败: {str(e)}")
-            return False
\ No newline at end of file
+            return False
+
+
+class PyInstallerInstallWorker(QThread):
+    """PyInstaller安装工作线程"""
+
+    output_received = pyqtSignal(str)   # 安装输出
+    install_finished = pyqtSignal(bool)  # 是否安装成功
+
+    def __init__(self, python_interpreter: str = "",
+                 installer: Optional[Callable[[Callable[[str], None]], bool]] = None):
+        super().__init__()
+        self.python_interpreter = python_interpreter
+        # 安装函数（如 MainController.install_pyinstaller），接收输出回调，返回是否成功
+        self.installer = installer
+
+    def run(self) -> None:
+        """执行安装"""
+        if self.installer is not None:
+            success = self.installer(self.output_received.emit)
+        else:
+            success = PyInstallerChecker.install_pyinstaller(self.output_received.emit, self.python_interpreter)
+        self.install_finished.emit(success)
@@ -35,7 +35,7 @@ def test_log_clear_functionality():
         window.show()
         
         # 测试日志功能
-        log_tab = window.log_tab
+        log_tab = window.ensure_tab("log_tab")
         
         if log_tab:
             print("✅ 找到日志标签页")
@@ -9,7 +9,7 @@ import tempfile
 import unittest
 from unittest.mock import Mock, patch, MagicMock
 from PyQt5.QtWidgets import QApplication
-from PyQt5.QtCore import QTimer
+from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtTest import QTest
 
 # 添加项目根目录到路径
@@ -230,11 +230,11 @@ class TestAsyncPackageService(unittest.TestCase):
         )
         
         # 验证信号连接
-        mock_worker.progress_updated.connect.assert_called_with(progress_callback)
-        mock_worker.output_received.connect.assert_called_with(output_callback)
-        mock_worker.error_occurred.connect.assert_called_with(error_callback)
-        mock_worker.finished_signal.connect.assert_called_with(finished_callback)
-        mock_worker.status_changed.connect.assert_called_with(status_callback)
+        mock_worker.progress_updated.connect.assert_called_with(progress_callback, Qt.QueuedConnection)
+        mock_worker.output_received.connect.assert_called_with(output_callback, Qt.QueuedConnection)
+        mock_worker.error_occurred.connect.assert_called_with(error_callback, Qt.QueuedConnection)
+        mock_worker.finished_signal.connect.assert_called_with(finished_callback, Qt.QueuedConnection)
+        mock_worker.status_changed.connect.assert_called_with(status_callback, Qt.QueuedConnection)
 
 
 class TestIntegration(unittest.TestCase):
@@ -5,6 +5,7 @@
 
 import os
 import json
+import heapq
 import pickle
 import hashlib
 import threading
@@ -225,7 +226,7 @@ class DiskCache:
                 item.touch()
                 # 更新索引中的访问信息
                 self.index[key].update({
-                    'last_accessed': item.last_accessed.isoformat(),
+                    'last_accessed': item.last_accessed.timestamp(),
                     'access_count': item.access_count
                 })
                 self._save_index()
@@ -250,7 +251,7 @@ class DiskCache:
                 # 更新索引
                 self.index[key] = {
                     'created_at': item.created_at.isoformat(),
-                    'last_accessed': item.last_accessed.isoformat(),
+                    'last_accessed': item.last_accessed.timestamp(),
                     'access_count': item.access_count,
                     'size': item.size,
                     'ttl': item.ttl,
@@ -314,27 +315,39 @@ class DiskCache:
             total_size += info.get('size', 0)
         return total_size
 
+    @staticmethod
+    def _last_accessed_key(entry: Tuple[str, Dict]) -> float:
+        """索引项的最后访问时间（epoch秒），兼容旧版ISO格式"""
+        last_accessed = entry[1].get('last_accessed')
+        if isinstance(last_accessed, (int, float)):
+            return float(last_accessed)
+        try:
+            return datetime.fromisoformat(last_accessed).timestamp()
+        except (TypeError, ValueError):
+            return 0.0
+
     def _cleanup_by_size(self):
         """按大小清理缓存"""
-        # 按最后访问时间排序
-        items = []
-        for key, info in self.index.items():
-            try:
-                last_accessed = datetime.fromisoformat(info['last_accessed'])
-                items.append((key, last_accessed, info.get('size', 0)))
-            except:
-                items.append((key, datetime.min, info.get('size', 0)))
-
-        items.sort(key=lambda x: x[1])  # 按时间排序
-
         current_size = self._calculate_total_size()
         target_size = int(self.max_size_bytes * 0.8)  # 清理到80%
-
-        for key, _, size in items:
-            if current_size <= target_size:
-                break
-            self.delete(key)
-            current_size -= size
+        if current_size <= target_size or not self.index:
+            return
+
+        # 只取出最久未访问的k项，避免对整个索引排序
+        avg_item_size = max(1, current_size // len(self.index))
+        k_est = max(16, (current_size - target_size) // avg_item_size)
+
+        while current_size > target_size and self.index:
+            items = heapq.nsmallest(k_est, self.index.items(), key=self._last_accessed_key)
+            for key, info in items:
+                if current_size <= target_size:
+                    break
+                size = info.get('size', 0)
+                self.delete(key)
+                current_size -= size
+            if len(items) < k_est:
+                break  # 已遍历全部索引项
+            k_est *= 2
 
     def get_stats(self) -> Dict[str, Any]:
         """获取缓存统计"""
@@ -370,35 +383,47 @@ class SmartCacheManager:
 
         # 统计信息
         self.stats = CacheStats()
+        self.stats_lock = threading.Lock()
         self.lock = threading.RLock()
 
         # 启动后台清理任务
         self._start_cleanup_thread()
 
     def get(self, key: str, default: Any = None) -> Any:
-        """获取缓存数据 - 多层查找"""
-        with self.lock:
-            # 1. 检查内存缓存
-            item = self.memory_cache.get(key)
-            if item is not None:
-                self.stats.hits += 1
-                self.stats.update_hit_rate()
-                return item.data
-
-            # 2. 检查磁盘缓存
-            item = self.disk_cache.get(key)
-            if item is not None:
-                self.stats.hits += 1
-                self.stats.update_hit_rate()
-
-                # 提升到内存缓存
-                self.memory_cache.set(key, item)
-                return item.data
-
-            # 3. 缓存未命中
+        """获取缓存数据 - 多层查找
+
+        子缓存各自持有锁，这里不占用全局锁，避免磁盘读取阻塞其他查找
+        """
+        # 1. 检查内存缓存
+        item = self.memory_cache.get(key)
+        if item is not None:
+            self._record_hit()
+            return item.data
+
+        # 2. 检查磁盘缓存
+        item = self.disk_cache.get(key)
+        if item is not None:
+            self._record_hit()
+
+            # 提升到内存缓存
+            self.memory_cache.set(key, item)
+            return item.data
+
+        # 3. 缓存未命中
+        self._record_miss()
+        return default
+
+    def _record_hit(self):
+        """记录一次命中"""
+        with self.stats_lock:
+            self.stats.hits += 1
+            self.stats.update_hit_rate()
+
+    def _record_miss(self):
+        """记录一次未命中"""
+        with self.stats_lock:
             self.stats.misses += 1
             self.stats.update_hit_rate()
-            return default
 
     def set(
         self,
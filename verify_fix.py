@@ -3,9 +3,23 @@
 验证Python解释器修复是否有效
 """
 
+import re
 import sys
 import os
-sys.path.insert(0, os.path.dirname(__file__))
+
+if __name__ == "__main__":
+    # 作为脚本运行时才需要把项目根目录加入导入路径
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# 匹配命令中的 --add-binary 参数
+_BIN_RE = re.compile(r'(?:^|\s)(--add-binary=\S+)')
+
+
+def _first_token(command):
+    """返回命令的第一个参数（Python解释器）"""
+    end = command.find(' ')
+    return command if end == -1 else command[:end]
+
 
 def verify_fix():
     """验证修复"""
@@ -36,31 +50,38 @@ def verify_fix():
     model.clean = True
     model.log_level = "INFO"
     
+    # 同一解释器只生成一次命令
+    command_cache = {}
+    
+    def generate(interpreter=""):
+        if interpreter not in command_cache:
+            command_cache[interpreter] = model.generate_command(interpreter)
+        return command_cache[interpreter]
+    
     print("生成命令对比:")
     print("-" * 30)
     
     # 测试1: 不传递python_interpreter参数（旧方式）
     print("1. 不传递python_interpreter参数:")
-    command1 = model.generate_command()
-    print(f"   Python解释器: {command1.split()[0]}")
+    command1 = generate()
+    print(f"   Python解释器: {_first_token(command1)}")
     
     # 查找--add-binary参数
-    parts = command1.split()
-    binary_paths = [part for part in parts if part.startswith("--add-binary=")]
-    if binary_paths:
-        print(f"   二进制文件示例: {binary_paths[0]}")
+    binary_match = _BIN_RE.search(command1)
+    if binary_match:
+        print(f"   二进制文件示例: {binary_match.group(1)}")
     print()
     
     # 测试2: 传递python_interpreter参数（新方式）
     print("2. 传递python_interpreter参数:")
-    command2 = model.generate_command(python_interpreter)
-    print(f"   Python解释器: {command2.split()[0]}")
+    command2 = generate(python_interpreter)
+    interpreter2 = _first_token(command2)
+    print(f"   Python解释器: {interpreter2}")
     
     # 查找--add-binary参数
-    parts = command2.split()
-    binary_paths = [part for part in parts if part.startswith("--add-binary=")]
-    if binary_paths:
-        print(f"   二进制文件示例: {binary_paths[0]}")
+    binary_match = _BIN_RE.search(command2)
+    if binary_match:
+        print(f"   二进制文件示例: {binary_match.group(1)}")
     print()
     
     # 分析结果
@@ -69,14 +90,15 @@ def verify_fix():
     
     if python_interpreter:
         # 检查Python解释器
-        if python_interpreter in command2:
+        # 解释器总是位于命令开头（可能带引号）
+        if command2.startswith(python_interpreter) or command2.startswith('"' + python_interpreter):
             print("✅ Python解释器修复成功")
         else:
             print("❌ Python解释器修复失败")
             
         # 检查二进制文件路径
-        if binary_paths:
-            binary_path = binary_paths[0].split("=")[1].split(";")[0]
+        if binary_match:
+            binary_path = binary_match.group(1).split("=")[1].split(";")[0]
             if python_interpreter.replace("python.exe", "") in binary_path:
                 print("✅ 二进制文件路径修复成功")
             else:
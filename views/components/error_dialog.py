@@ -2,6 +2,9 @@
 用户友好的错误对话框组件
 """
 import os
+import html
+import platform
+import subprocess
 from typing import Dict, List, Optional, Any
 from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
@@ -10,11 +13,126 @@ from PyQt5.QtWidgets import (
 )
 from PyQt5.QtCore import Qt, pyqtSignal, QThread, pyqtSlot
 from PyQt5.QtGui import QFont, QPixmap, QIcon
+from PyQt5 import sip
 
 from utils.error_diagnostics import get_error_diagnostics, try_auto_fix
 from utils.logger import log_info, log_error
 
 
+# 严重程度查找表（索引: low=0, medium=1, high=2）
+_SEVERITY_IDX = {'low': 0, 'medium': 1, 'high': 2}
+_SEVERITY_TEXT = ('低', '中', '高')
+_SEVERITY_COLOR = ('#4CAF50', '#FF9800', '#F44336')
+_SEVERITY_ICON = ('images/info.png', 'images/warning.png', 'images/error.png')
+# 导入时检查一次图标文件，缺失的记为None（QPixmap需在QApplication创建后才能构造）
+_SEVERITY_ICON_PATHS = tuple(p if os.path.exists(p) else None for p in _SEVERITY_ICON)
+
+# 字体与样式表（导入时构造一次）
+_FONT_BOLD_12 = QFont("", 12, QFont.Bold)
+_FONT_BOLD_10 = QFont("", 10, QFont.Bold)
+_FONT_BOLD_9 = QFont("", 9, QFont.Bold)
+
+_DIALOG_QSS = """
+    QDialog {
+        background-color: #f5f5f5;
+    }
+    QFrame {
+        background-color: white;
+        border-radius: 6px;
+        padding: 10px;
+    }
+    QLabel {
+        color: #333;
+    }
+    QPushButton {
+        background-color: #2196F3;
+        color: white;
+        border: none;
+        padding: 8px 16px;
+        border-radius: 4px;
+    }
+    QPushButton:hover {
+        background-color: #1976D2;
+    }
+    QTextEdit {
+        border: 1px solid #ddd;
+        border-radius: 4px;
+        padding: 8px;
+        background-color: #fafafa;
+    }
+    QLabel#severityIcon {
+        font-size: 32px;
+    }
+    QLabel#severityLabel {
+        color: #757575;
+        font-weight: bold;
+    }
+    QLabel#tipsLabel {
+        color: #666;
+        font-size: 9px;
+        margin: 5px;
+    }
+    QFrame#autoFixFrame {
+        background-color: #E8F5E8;
+        border: 1px solid #4CAF50;
+    }
+    QFrame#autoFixFrame QLabel {
+        background-color: #E8F5E8;
+    }
+    QLabel#autoFixTitle {
+        color: #2E7D32;
+    }
+    QPushButton#autoFixBtn {
+        background-color: #4CAF50;
+        font-weight: bold;
+    }
+    QPushButton#autoFixBtn:hover {
+        background-color: #45a049;
+    }
+    QPushButton#autoFixBtn:disabled {
+        background-color: #cccccc;
+    }
+    QLabel#progressLabel[result="success"] {
+        color: #4CAF50;
+        font-weight: bold;
+    }
+    QLabel#progressLabel[result="failure"] {
+        color: #F44336;
+        font-weight: bold;
+    }
+    QPushButton#autoFixBtn[result="success"] {
+        background-color: #4CAF50;
+    }
+    QPushButton#autoFixBtn[result="failure"] {
+        background-color: #F44336;
+    }
+""" + "".join(
+    f'    QLabel#severityLabel[severity="{name}"] {{ color: {_SEVERITY_COLOR[idx]}; }}\n'
+    for name, idx in _SEVERITY_IDX.items()
+)
+
+# 当前平台打开目录所用的命令
+_PLATFORM = platform.system()
+_OPENER = {'Windows': ['explorer'], 'Darwin': ['open']}.get(_PLATFORM, ['xdg-open'])
+
+# 对话框关闭时仍未结束的自动修复线程
+_orphan_workers = set()
+
+# show_error_dialog 复用的对话框实例
+_shared_dialog = None
+
+# 错误诊断实例（首次使用时获取并缓存）
+_diagnostics_instance = None
+
+
+def _diag():
+    """获取缓存的错误诊断实例"""
+    global _diagnostics_instance
+    if _diagnostics_instance is None:
+        _diagnostics_instance = get_error_diagnostics()
+    return _diagnostics_instance
+
+
 class AutoFixWorker(QThread):
     """自动修复工作线程"""
     
@@ -30,20 +148,14 @@ class AutoFixWorker(QThread):
     def run(self):
         """执行自动修复"""
         try:
-            self.progress_updated.emit(10, "正在分析错误...")
-            
-            # 模拟分析过程
-            self.msleep(500)
-            self.progress_updated.emit(30, "正在查找解决方案...")
+            self.progress_updated.emit(10, "正在应用修复...")
             
-            self.msleep(500)
-            self.progress_updated.emit(50, "正在应用修复...")
-            
-            # 执行自动修复
+            # 执行自动修复（可能阻塞，如安装模块，因此保留在工作线程中）
             success, message = try_auto_fix(self.error_type, self.error_message, self.context)
             
-            self.progress_updated.emit(90, "正在验证修复结果...")
-            self.msleep(300)
+            # 对话框已关闭则不再回传结果
+            if self.isInterruptionRequested():
+                return
             
             self.progress_updated.emit(100, "修复完成")
             self.fix_completed.emit(success, message)
@@ -54,6 +166,9 @@ class AutoFixWorker(QThread):
 
 class ErrorDialog(QDialog):
     """用户友好的错误对话框"""
+
+    # 按严重程度索引缓存已缩放的图标，图标缺失时缓存None
+    _PIXMAP_CACHE: Dict[int, Optional[QPixmap]] = {}
     
     def __init__(self, error_type: str, error_message: str, context: Dict[str, Any] = None, parent=None):
         super().__init__(parent)
@@ -63,25 +178,35 @@ class ErrorDialog(QDialog):
         self.diagnosis = None
         self.auto_fix_worker = None
         
+        # 自动修复区域控件（仅在诊断提供自动修复时创建）
+        self.auto_fix_btn = None
+        self.progress_bar = None
+        self.progress_label = None
+        
         self.setWindowTitle("错误详情")
         self.setModal(True)
+        # 关闭后释放底层C++对象，避免长时间运行时对话框堆积
+        self.setAttribute(Qt.WA_DeleteOnClose)
         self.resize(600, 500)
         
         # 获取错误诊断
         self._get_diagnosis()
         
-        # 设置UI
-        self._setup_ui()
-        self._setup_styles()
-        
-        # 连接信号
-        self._connect_signals()
+        # 界面在首次显示时才构建，未显示的对话框不创建控件树
+        self._ui_built = False
+    
+    def showEvent(self, event):
+        """首次显示时构建界面"""
+        if not self._ui_built:
+            self._ui_built = True
+            self._setup_ui()
+            self._setup_styles()
+        super().showEvent(event)
     
     def _get_diagnosis(self):
         """获取错误诊断信息"""
         try:
-            diagnostics = get_error_diagnostics()
-            self.diagnosis = diagnostics.diagnose_error(self.error_type, self.error_message, self.context)
+            self.diagnosis = _diag().diagnose_error(self.error_type, self.error_message, self.context)
         except Exception as e:
             log_error(f"获取错误诊断失败: {e}")
             self.diagnosis = {
@@ -93,12 +218,48 @@ class ErrorDialog(QDialog):
                 'prevention_tips': [],
                 'related_docs': []
             }
+
+        # 一次性解包常用字段
+        d = self.diagnosis
+        self._severity = d.get('severity', 'medium')
+        self._root_cause = d.get('root_cause', '未知原因')
+        self._solutions = tuple(d.get('solutions', ()))
+        self._prevention_text = "\n".join(f"• {tip}" for tip in d.get('prevention_tips', ()))
+        self._has_prevention = bool(self._prevention_text)
+        self._has_autofix = bool(d.get('auto_fix_available', False))
+
+        # 诊断结果不再变化，预先生成复制到剪贴板的文本
+        self._clipboard_text = self._build_clipboard_text()
+
+    def _build_clipboard_text(self) -> str:
+        """生成复制到剪贴板的错误信息"""
+        parts = [f"""错误类型: {self.error_type}
+错误消息: {self.error_message}
+根本原因: {self._root_cause}
+严重程度: {self._severity}
+
+建议解决方案:
+"""]
+        parts.extend(f"{i}. {solution}\n" for i, solution in enumerate(self._solutions, 1))
+        return "".join(parts)
+    
+    def set_error(self, error_type: str, error_message: str, context: Dict[str, Any] = None):
+        """更换显示的错误，复用已有控件"""
+        self._stop_auto_fix_worker()
+        self.error_type = error_type
+        self.error_message = error_message
+        self.context = context or {}
+        self._get_diagnosis()
+        if self._ui_built:
+            self._populate_ui()
     
     def _setup_ui(self):
         """设置用户界面"""
         layout = QVBoxLayout(self)
         layout.setSpacing(15)
         layout.setContentsMargins(20, 20, 20, 20)
+        self._main_layout = layout
+        self._auto_fix_frame = None
         
         # 错误标题区域
         self._create_header_section(layout)
@@ -109,12 +270,51 @@ class ErrorDialog(QDialog):
         # 解决方案区域
         self._create_solutions_section(layout)
         
-        # 自动修复区域
-        if self.diagnosis.get('auto_fix_available', False):
-            self._create_auto_fix_section(layout)
-        
         # 按钮区域
         self._create_button_section(layout)
+        
+        # 填充当前错误的内容
+        self._populate_ui()
+    
+    def _populate_ui(self):
+        """将当前诊断结果填充到控件中"""
+        severity = self._severity
+        pixmap = self._get_severity_pixmap(severity)
+        if pixmap is not None:
+            self._icon_label.setPixmap(pixmap)
+        else:
+            self._icon_label.setText("⚠️")
+        
+        self._error_type_label.setText(f"错误类型: {self.error_type}")
+        self._cause_label.setText(f"原因: {self._root_cause}")
+        
+        idx = _SEVERITY_IDX.get(severity)
+        severity_text = _SEVERITY_TEXT[idx] if idx is not None else '未知'
+        self._severity_label.setText(f"严重程度: {severity_text}")
+        self._severity_label.setProperty("severity", severity)
+        self._severity_label.style().unpolish(self._severity_label)
+        self._severity_label.style().polish(self._severity_label)
+        
+        self.details_text.setPlainText(self.error_message)
+        
+        # 所有方案合并到一个标签中，只需一次布局与绘制
+        self._solutions_display.setText("".join(
+            f"<p>{i}. {html.escape(str(solution))}</p>"
+            for i, solution in enumerate(self._solutions, 1)
+        ))
+        
+        self._tips_label.setVisible(self._has_prevention)
+        self._tips_display.setVisible(self._has_prevention)
+        self._tips_display.setText(self._prevention_text)
+        
+        # 自动修复区域（需要时才创建，插入到按钮区域之前）
+        if self._has_autofix:
+            if self._auto_fix_frame is None:
+                self._create_auto_fix_section(self._main_layout)
+            self._reset_auto_fix_section()
+            self._auto_fix_frame.setVisible(True)
+        elif self._auto_fix_frame is not None:
+            self._auto_fix_frame.setVisible(False)
     
     def _create_header_section(self, parent_layout):
         """创建错误标题区域"""
@@ -123,39 +323,29 @@ class ErrorDialog(QDialog):
         header_layout = QHBoxLayout(header_frame)
         
         # 错误图标
-        icon_label = QLabel()
-        severity = self.diagnosis.get('severity', 'medium')
-        icon_path = self._get_severity_icon(severity)
-        if os.path.exists(icon_path):
-            pixmap = QPixmap(icon_path).scaled(48, 48, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            icon_label.setPixmap(pixmap)
-        else:
-            icon_label.setText("⚠️")
-            icon_label.setStyleSheet("font-size: 32px;")
+        self._icon_label = QLabel()
+        self._icon_label.setObjectName("severityIcon")
         
         # 错误信息
         info_layout = QVBoxLayout()
         
         # 错误类型
-        error_type_label = QLabel(f"错误类型: {self.error_type}")
-        error_type_label.setFont(QFont("", 12, QFont.Bold))
+        self._error_type_label = QLabel()
+        self._error_type_label.setFont(_FONT_BOLD_12)
         
         # 根本原因
-        root_cause = self.diagnosis.get('root_cause', '未知原因')
-        cause_label = QLabel(f"原因: {root_cause}")
-        cause_label.setWordWrap(True)
+        self._cause_label = QLabel()
+        self._cause_label.setWordWrap(True)
         
         # 严重程度
-        severity_text = {'low': '低', 'medium': '中', 'high': '高'}.get(severity, '未知')
-        severity_label = QLabel(f"严重程度: {severity_text}")
-        severity_color = {'low': '#4CAF50', 'medium': '#FF9800', 'high': '#F44336'}.get(severity, '#757575')
-        severity_label.setStyleSheet(f"color: {severity_color}; font-weight: bold;")
+        self._severity_label = QLabel()
+        self._severity_label.setObjectName("severityLabel")
         
-        info_layout.addWidget(error_type_label)
-        info_layout.addWidget(cause_label)
-        info_layout.addWidget(severity_label)
+        info_layout.addWidget(self._error_type_label)
+        info_layout.addWidget(self._cause_label)
+        info_layout.addWidget(self._severity_label)
         
-        header_layout.addWidget(icon_label)
+        header_layout.addWidget(self._icon_label)
         header_layout.addLayout(info_layout)
         header_layout.addStretch()
         
@@ -164,12 +354,11 @@ class ErrorDialog(QDialog):
     def _create_details_section(self, parent_layout):
         """创建错误详情区域"""
         details_label = QLabel("错误详情:")
-        details_label.setFont(QFont("", 10, QFont.Bold))
+        details_label.setFont(_FONT_BOLD_10)
         parent_layout.addWidget(details_label)
         
         # 错误消息文本框
         self.details_text = QTextEdit()
-        self.details_text.setPlainText(self.error_message)
         self.details_text.setMaximumHeight(100)
         self.details_text.setReadOnly(True)
         parent_layout.addWidget(self.details_text)
@@ -177,7 +366,7 @@ class ErrorDialog(QDialog):
     def _create_solutions_section(self, parent_layout):
         """创建解决方案区域"""
         solutions_label = QLabel("建议的解决方案:")
-        solutions_label.setFont(QFont("", 10, QFont.Bold))
+        solutions_label.setFont(_FONT_BOLD_10)
         parent_layout.addWidget(solutions_label)
         
         # 解决方案列表
@@ -185,39 +374,35 @@ class ErrorDialog(QDialog):
         solutions_frame.setFrameStyle(QFrame.StyledPanel)
         solutions_layout = QVBoxLayout(solutions_frame)
         
-        solutions = self.diagnosis.get('solutions', [])
-        for i, solution in enumerate(solutions, 1):
-            solution_label = QLabel(f"{i}. {solution}")
-            solution_label.setWordWrap(True)
-            solution_label.setMargin(5)
-            solutions_layout.addWidget(solution_label)
+        self._solutions_display = QLabel()
+        self._solutions_display.setTextFormat(Qt.RichText)
+        self._solutions_display.setWordWrap(True)
+        self._solutions_display.setMargin(5)
+        solutions_layout.addWidget(self._solutions_display)
         
         parent_layout.addWidget(solutions_frame)
         
         # 预防提示
-        prevention_tips = self.diagnosis.get('prevention_tips', [])
-        if prevention_tips:
-            tips_label = QLabel("预防提示:")
-            tips_label.setFont(QFont("", 9, QFont.Bold))
-            parent_layout.addWidget(tips_label)
-            
-            tips_text = "\n".join(f"• {tip}" for tip in prevention_tips)
-            tips_display = QLabel(tips_text)
-            tips_display.setWordWrap(True)
-            tips_display.setStyleSheet("color: #666; font-size: 9px; margin: 5px;")
-            parent_layout.addWidget(tips_display)
+        self._tips_label = QLabel("预防提示:")
+        self._tips_label.setFont(_FONT_BOLD_9)
+        parent_layout.addWidget(self._tips_label)
+        
+        self._tips_display = QLabel()
+        self._tips_display.setWordWrap(True)
+        self._tips_display.setObjectName("tipsLabel")
+        parent_layout.addWidget(self._tips_display)
     
     def _create_auto_fix_section(self, parent_layout):
         """创建自动修复区域"""
         auto_fix_frame = QFrame()
         auto_fix_frame.setFrameStyle(QFrame.StyledPanel)
-        auto_fix_frame.setStyleSheet("background-color: #E8F5E8; border: 1px solid #4CAF50;")
+        auto_fix_frame.setObjectName("autoFixFrame")
         auto_fix_layout = QVBoxLayout(auto_fix_frame)
         
         # 自动修复标题
         auto_fix_label = QLabel("🔧 自动修复")
-        auto_fix_label.setFont(QFont("", 10, QFont.Bold))
-        auto_fix_label.setStyleSheet("color: #2E7D32;")
+        auto_fix_label.setFont(_FONT_BOLD_10)
+        auto_fix_label.setObjectName("autoFixTitle")
         
         # 自动修复说明
         fix_desc = QLabel("系统可以尝试自动修复此问题，是否要尝试？")
@@ -225,30 +410,15 @@ class ErrorDialog(QDialog):
         
         # 进度条（初始隐藏）
         self.progress_bar = QProgressBar()
-        self.progress_bar.setVisible(False)
         
         # 进度状态标签
         self.progress_label = QLabel()
-        self.progress_label.setVisible(False)
+        self.progress_label.setObjectName("progressLabel")
         
         # 自动修复按钮
-        self.auto_fix_btn = QPushButton("尝试自动修复")
-        self.auto_fix_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:disabled {
-                background-color: #cccccc;
-            }
-        """)
+        self.auto_fix_btn = QPushButton()
+        self.auto_fix_btn.setObjectName("autoFixBtn")
+        self.auto_fix_btn.clicked.connect(self._start_auto_fix)
         
         auto_fix_layout.addWidget(auto_fix_label)
         auto_fix_layout.addWidget(fix_desc)
@@ -256,7 +426,23 @@ class ErrorDialog(QDialog):
         auto_fix_layout.addWidget(self.progress_label)
         auto_fix_layout.addWidget(self.auto_fix_btn)
         
-        parent_layout.addWidget(auto_fix_frame)
+        # 按钮区域始终位于最后
+        parent_layout.insertWidget(parent_layout.count() - 1, auto_fix_frame)
+        self._auto_fix_frame = auto_fix_frame
+    
+    def _reset_auto_fix_section(self):
+        """恢复自动修复区域的初始状态"""
+        self.progress_bar.setValue(0)
+        self.progress_bar.setVisible(False)
+        self.progress_label.clear()
+        self.progress_label.setVisible(False)
+        self.auto_fix_btn.setText("尝试自动修复")
+        self.auto_fix_btn.setEnabled(True)
+        for widget in (self.progress_label, self.auto_fix_btn):
+            if widget.property("result") is not None:
+                widget.setProperty("result", None)
+                widget.style().unpolish(widget)
+                widget.style().polish(widget)
     
     def _create_button_section(self, parent_layout):
         """创建按钮区域"""
@@ -284,49 +470,19 @@ class ErrorDialog(QDialog):
     
     def _setup_styles(self):
         """设置样式"""
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #f5f5f5;
-            }
-            QFrame {
-                background-color: white;
-                border-radius: 6px;
-                padding: 10px;
-            }
-            QLabel {
-                color: #333;
-            }
-            QPushButton {
-                background-color: #2196F3;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #1976D2;
-            }
-            QTextEdit {
-                border: 1px solid #ddd;
-                border-radius: 4px;
-                padding: 8px;
-                background-color: #fafafa;
-            }
-        """)
-    
-    def _connect_signals(self):
-        """连接信号"""
-        if hasattr(self, 'auto_fix_btn'):
-            self.auto_fix_btn.clicked.connect(self._start_auto_fix)
+        self.setStyleSheet(_DIALOG_QSS)
     
-    def _get_severity_icon(self, severity: str) -> str:
-        """获取严重程度图标路径"""
-        icon_map = {
-            'low': 'images/info.png',
-            'medium': 'images/warning.png',
-            'high': 'images/error.png'
-        }
-        return icon_map.get(severity, 'images/warning.png')
+    @classmethod
+    def _get_severity_pixmap(cls, severity: str) -> Optional[QPixmap]:
+        """获取严重程度图标（首次加载后缓存）"""
+        idx = _SEVERITY_IDX.get(severity, 1)
+        if idx not in cls._PIXMAP_CACHE:
+            icon_path = _SEVERITY_ICON_PATHS[idx]
+            cls._PIXMAP_CACHE[idx] = (
+                QPixmap(icon_path).scaled(48, 48, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+                if icon_path else None
+            )
+        return cls._PIXMAP_CACHE[idx]
     
     @pyqtSlot()
     def _start_auto_fix(self):
@@ -337,10 +493,34 @@ class ErrorDialog(QDialog):
         
         # 创建并启动自动修复工作线程
         self.auto_fix_worker = AutoFixWorker(self.error_type, self.error_message, self.context)
-        self.auto_fix_worker.progress_updated.connect(self._on_fix_progress)
-        self.auto_fix_worker.fix_completed.connect(self._on_fix_completed)
+        self.auto_fix_worker.progress_updated.connect(self._on_fix_progress, Qt.QueuedConnection)
+        self.auto_fix_worker.fix_completed.connect(self._on_fix_completed, Qt.QueuedConnection)
         self.auto_fix_worker.start()
     
+    def _stop_auto_fix_worker(self):
+        """停止自动修复线程并断开其信号"""
+        worker = self.auto_fix_worker
+        if worker is None:
+            return
+        try:
+            worker.progress_updated.disconnect(self._on_fix_progress)
+            worker.fix_completed.disconnect(self._on_fix_completed)
+        except TypeError:
+            pass  # 信号已断开
+        if worker.isRunning():
+            worker.requestInterruption()
+            worker.quit()
+            if not worker.wait(200):
+                # 修复调用仍在阻塞，保留引用直到线程结束，避免销毁运行中的QThread
+                _orphan_workers.add(worker)
+                worker.finished.connect(lambda w=worker: _orphan_workers.discard(w))
+        self.auto_fix_worker = None
+    
+    def done(self, result: int):
+        """关闭对话框（accept/reject/关闭按钮均经过此处）"""
+        self._stop_auto_fix_worker()
+        super().done(result)
+    
     @pyqtSlot(int, str)
     def _on_fix_progress(self, progress: int, status: str):
         """自动修复进度更新"""
@@ -353,34 +533,29 @@ class ErrorDialog(QDialog):
         self.progress_bar.setVisible(False)
         self.progress_label.setText(f"修复结果: {message}")
         
-        if success:
-            self.progress_label.setStyleSheet("color: #4CAF50; font-weight: bold;")
-            self.auto_fix_btn.setText("修复成功")
-            self.auto_fix_btn.setStyleSheet("background-color: #4CAF50;")
+        result = "success" if success else "failure"
+        self.auto_fix_btn.setText("修复成功" if success else "修复失败")
+        
+        # 通过动态属性切换样式，只重新polish这两个控件
+        for widget in (self.progress_label, self.auto_fix_btn):
+            widget.setProperty("result", result)
+            widget.style().unpolish(widget)
+            widget.style().polish(widget)
+    
+    def _show_status(self, message: str):
+        """在进度标签中显示提示，无自动修复区域时记录到日志"""
+        if self.progress_label is not None and self._has_autofix:
+            self.progress_label.setText(message)
+            self.progress_label.setVisible(True)
         else:
-            self.progress_label.setStyleSheet("color: #F44336; font-weight: bold;")
-            self.auto_fix_btn.setText("修复失败")
-            self.auto_fix_btn.setStyleSheet("background-color: #F44336;")
+            log_info(message)
     
     @pyqtSlot()
     def _copy_error_info(self):
         """复制错误信息到剪贴板"""
         try:
-            clipboard = QApplication.clipboard()
-            error_info = f"""错误类型: {self.error_type}
-错误消息: {self.error_message}
-根本原因: {self.diagnosis.get('root_cause', '未知')}
-严重程度: {self.diagnosis.get('severity', '未知')}
-
-建议解决方案:
-"""
-            solutions = self.diagnosis.get('solutions', [])
-            for i, solution in enumerate(solutions, 1):
-                error_info += f"{i}. {solution}\n"
-            
-            clipboard.setText(error_info)
-            self.progress_label.setText("错误信息已复制到剪贴板")
-            self.progress_label.setVisible(True)
+            QApplication.clipboard().setText(self._clipboard_text)
+            self._show_status("错误信息已复制到剪贴板")
             
         except Exception as e:
             log_error(f"复制错误信息失败: {e}")
@@ -389,26 +564,28 @@ class ErrorDialog(QDialog):
     def _open_log_file(self):
         """打开日志文件"""
         try:
-            import subprocess
-            import platform
-            
             log_dir = "logs"
             if os.path.exists(log_dir):
-                if platform.system() == "Windows":
-                    subprocess.run(["explorer", log_dir])
-                elif platform.system() == "Darwin":  # macOS
-                    subprocess.run(["open", log_dir])
-                else:  # Linux
-                    subprocess.run(["xdg-open", log_dir])
+                subprocess.run([*_OPENER, log_dir])
             else:
-                self.progress_label.setText("日志目录不存在")
-                self.progress_label.setVisible(True)
+                self._show_status("日志目录不存在")
                 
         except Exception as e:
             log_error(f"打开日志文件失败: {e}")
 
 
 def show_error_dialog(error_type: str, error_message: str, context: Dict[str, Any] = None, parent=None):
-    """显示错误对话框"""
-    dialog = ErrorDialog(error_type, error_message, context, parent)
+    """显示错误对话框（同一父窗口复用同一个对话框实例）"""
+    global _shared_dialog
+    dialog = _shared_dialog
+    if dialog is not None and not sip.isdeleted(dialog) and dialog.isVisible():
+        # 共享实例正在显示（错误处理过程中再次出错），使用独立的对话框
+        return ErrorDialog(error_type, error_message, context, parent).exec_()
+    if dialog is None or sip.isdeleted(dialog) or dialog.parent() is not parent:
+        dialog = ErrorDialog(error_type, error_message, context, parent)
+        # 共享实例在关闭后保留，供下次复用
+        dialog.setAttribute(Qt.WA_DeleteOnClose, False)
+        _shared_dialog = dialog
+    else:
+        dialog.set_error(error_type, error_message, context)
     return dialog.exec_()
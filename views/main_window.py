@@ -1,34 +1,212 @@
 """
 主窗口视图
 """
+import logging
 import os
-import subprocess
-import platform
-from typing import Optional
+from collections import OrderedDict, deque
+from enum import IntEnum
+from typing import TYPE_CHECKING, Dict, Optional
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QTabWidget,
     QMessageBox, QProgressBar, QTextEdit, QPushButton, QHBoxLayout,
-    QApplication, QDesktopWidget, QFrame, QLabel
+    QApplication, QFrame, QLabel, QDialog, QCheckBox, QProgressDialog, QStyle
 )
-from PyQt5.QtCore import Qt, pyqtSlot
-from PyQt5.QtGui import QFont, QIcon
+from PyQt5.QtCore import (
+    Qt, QEventLoop, QProcess, QSize, QThread, QTimer, QUrl, pyqtSignal, pyqtSlot
+)
+from PyQt5.QtGui import QFont, QIcon, QDesktopServices
 
 from config.app_config import AppConfig
 from models.packer_model import PyInstallerModel
-from services.package_service import PackageService, PyInstallerChecker, AsyncPackageService
+from services.package_service import (
+    PackageService, AsyncPackageService, PyInstallerInstallWorker
+)
 from services.module_detector import ModuleDetector
-from views.tabs.basic_tab import BasicTab
-from views.tabs.advanced_tab import AdvancedTab
-from views.tabs.module_tab import ModuleTab
-from views.tabs.settings_tab import SettingsTab
-from views.tabs.log_tab import LogTab
 from views.menu_bar import MenuBarManager
 from views.components.error_dialog import show_error_dialog
-from about_dialog import AboutDialog
+
+if TYPE_CHECKING:
+    # 标签页模块在首次构建对应标签页时才导入
+    from views.tabs.basic_tab import BasicTab
+    from views.tabs.advanced_tab import AdvancedTab
+    from views.tabs.module_tab import ModuleTab
+    from views.tabs.settings_tab import SettingsTab
+    from views.tabs.log_tab import LogTab
+
+logger = logging.getLogger(__name__)
+
+# 工具栏按钮：objectName -> (基础色, 悬停色, 按下色)
+_TOOLBAR_BUTTON_COLORS = {
+    "toolbarGenerateBtn": ("#4CAF50", "#45a049", "#3d8b40"),
+    "toolbarStartBtn": ("#2196F3", "#1976D2", "#1565C0"),
+    "toolbarCancelBtn": ("#FF9800", "#F57C00", "#E65100"),
+    "toolbarClearBtn": ("#f44336", "#d32f2f", "#c62828"),
+}
+
+# 工具栏样式表（按objectName区分，只在工具栏容器上设置一次）
+_TOOLBAR_QSS = """
+    QFrame#toolbarFrame {
+        background-color: #f0f0f0;
+        border: 1px solid #d0d0d0;
+        border-radius: 3px;
+        margin: 2px;
+        padding: 4px;
+    }
+    QLabel#toolbarStatus {
+        color: #666;
+        font-size: 12px;
+        padding: 4px 8px;
+        background-color: #e8e8e8;
+        border-radius: 10px;
+    }
+    #toolbarFrame QPushButton {
+        color: white;
+        border: none;
+        padding: 8px 16px;
+        border-radius: 4px;
+        font-weight: bold;
+        font-size: 13px;
+        min-width: 100px;
+    }
+""" + "".join(
+    f"""
+    QPushButton#{name} {{ background-color: {color}; }}
+    QPushButton#{name}:hover {{ background-color: {hover}; }}
+    QPushButton#{name}:pressed {{ background-color: {pressed}; }}
+"""
+    for name, (color, hover, pressed) in _TOOLBAR_BUTTON_COLORS.items()
+) + """
+    #toolbarFrame QPushButton:disabled {
+        background-color: #cccccc;
+        color: #666666;
+    }
+"""
+
+
+class _SuggestionsResult(IntEnum):
+    """智能建议对话框的返回值"""
+    CANCEL = int(QDialog.Rejected)  # 取消打包
+    APPLY = int(QDialog.Accepted)   # 应用建议并继续打包
+    SKIP = 2                        # 跳过建议，直接打包
+
+
+# 智能模块检测结果最多缓存的脚本数
+_DETECTION_CACHE_SIZE = 32
+
+# 输出缓冲的最大行数，达到后立即写入日志页
+_LOG_BUF_MAX_LINES = 500
+
+# 日志页不可见时最多暂存的输出行数（超出后丢弃最早的行）
+_HIDDEN_LOG_MAX_LINES = 100000
+
+# 结果已处理但仍未结束的后台线程（智能分析、PyInstaller安装）
+_orphan_workers = set()
+
+
+# 智能模块检测使用的检测函数（首次检测时确定，之后复用）
+_detection_backend = None
+
+
+def _get_detection_backend():
+    """确定可用的检测器，检测器模块只导入一次"""
+    global _detection_backend
+    if _detection_backend is None:
+        try:
+            # 优先使用性能优化检测器
+            from services.performance_optimized_detector import PerformanceOptimizedDetector
+
+            def backend(script_path: str, python_interpreter: str):
+                detector = PerformanceOptimizedDetector(
+                    python_interpreter=python_interpreter,
+                    timeout=30  # 30秒超时，避免阻塞太久
+                )
+                return detector.detect_modules(script_path)
+        except ImportError:
+            # 回退到智能分析器
+            from services.intelligent_module_analyzer import IntelligentModuleAnalyzer
+
+            def backend(script_path: str, python_interpreter: str):
+                analyzer = IntelligentModuleAnalyzer(
+                    python_interpreter=python_interpreter,
+                    timeout=30
+                )
+                return analyzer.analyze_script(
+                    script_path=script_path,
+                    use_execution=False,  # 快速模式
+                    enable_ml_scoring=False
+                )
+        _detection_backend = backend
+    return _detection_backend
+
+
+def _detect_script_modules(script_path: str, python_interpreter: str) -> dict:
+    """执行智能模块检测
+
+    Returns:
+        dict: 检测结果
+    """
+    try:
+        result = _get_detection_backend()(script_path, python_interpreter)
+        return {
+            'modules': result.recommended_modules,
+            'hidden_imports': result.hidden_imports,
+            'analysis': result
+        }
+    except Exception as e:
+        # 如果检测失败，返回空结果
+        return {
+            'modules': [],
+            'hidden_imports': [],
+            'analysis': None,
+            'error': str(e)
+        }
+
+
+class SmartSuggestionsWorker(QThread):
+    """打包前智能分析工作线程"""
+
+    progress = pyqtSignal(int, str)  # 进度, 说明
+    analysis_finished = pyqtSignal(int, dict)  # 建议超时时间, 模块检测结果
+    analysis_failed = pyqtSignal(str)  # 错误信息
+
+    def __init__(self, config: AppConfig, script_path: str, python_interpreter: str,
+                 cached_result: Optional[dict] = None, parent=None):
+        super().__init__(parent)
+        self.config = config
+        self.script_path = script_path
+        self.python_interpreter = python_interpreter
+        self.cached_result = cached_result  # 已缓存的检测结果，存在时跳过模块检测
+
+    def run(self) -> None:
+        """依次执行超时分析和模块检测"""
+        try:
+            self.progress.emit(20, "正在分析项目复杂度...")
+            suggested_timeout = self.config.suggest_timeout_for_project(self.script_path)
+            if self.isInterruptionRequested():
+                return
+
+            self.progress.emit(40, "正在检测项目依赖...")
+            detection_result = self.cached_result
+            if detection_result is None:
+                detection_result = _detect_script_modules(self.script_path, self.python_interpreter)
+            if self.isInterruptionRequested():
+                return
+
+            self.progress.emit(100, "分析完成，准备显示结果...")
+            self.analysis_finished.emit(suggested_timeout, detection_result)
+        except Exception as e:
+            self.analysis_failed.emit(str(e))
+
 
 class MainWindow(QMainWindow):
     """主窗口类"""
 
+    # 确认对话框的按钮组合
+    _YES_NO = QMessageBox.Yes | QMessageBox.No
+
+    # 窗口图标（首次使用时加载，之后复用）
+    _APP_ICON: Optional[QIcon] = None
+
     def __init__(self, config=None, model=None, controller=None):
         super().__init__()
         self.config = config if config is not None else AppConfig()
@@ -36,21 +214,78 @@ class MainWindow(QMainWindow):
         self.controller = controller
         self.package_service: Optional[PackageService] = None
         self.async_package_service: Optional[AsyncPackageService] = None
+        self._install_worker: Optional[PyInstallerInstallWorker] = None
         self.module_detector = ModuleDetector(
             use_ast=self.config.get("use_ast_detection", True),
             use_pyinstaller=self.config.get("use_pyinstaller_detection", False)
         )
 
         # 标签页组件
-        self.basic_tab: Optional[BasicTab] = None
-        self.advanced_tab: Optional[AdvancedTab] = None
-        self.module_tab: Optional[ModuleTab] = None
-        self.settings_tab: Optional[SettingsTab] = None
-        self.log_tab: Optional[LogTab] = None
+        self.basic_tab: Optional['BasicTab'] = None
+        self.advanced_tab: Optional['AdvancedTab'] = None
+        self.module_tab: Optional['ModuleTab'] = None
+        self.settings_tab: Optional['SettingsTab'] = None
+        self.log_tab: Optional['LogTab'] = None
+
+        # 输出目录及其绝对路径缓存 (output_dir, abs_output_dir)
+        self._abs_output_dir: Optional[tuple] = None
+
+        # 日志页不可见期间是否有被推迟的预览更新
+        self._preview_dirty = False
+
+        # 上次生成的命令及其依赖的状态
+        self._last_cmd_key: Optional[tuple] = None
+        self._last_cmd: str = ""
+
+        # 命令预览合并定时器（输入停顿150ms后才更新）
+        self._cmd_preview_timer = QTimer(self)
+        self._cmd_preview_timer.setSingleShot(True)
+        self._cmd_preview_timer.setInterval(150)
+        self._cmd_preview_timer.timeout.connect(self._do_update_preview)
+
+        # 打包输出缓冲，定时批量写入日志页；日志页不可见时暂存到切换回来为止
+        self._log_buf: deque = deque(maxlen=_HIDDEN_LOG_MAX_LINES)
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setInterval(50)
+        self._log_flush_timer.timeout.connect(self._flush_log)
+
+        # 智能模块检测结果缓存 (脚本路径, 修改时间, 大小, 解释器) -> 检测结果
+        self._detection_cache: 'OrderedDict[tuple, dict]' = OrderedDict()
+
+        # 状态栏消息合并定时器，最多每100ms刷新一次状态栏
+        self._pending_status: Optional[tuple] = None
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(100)
+        self._status_timer.timeout.connect(self._flush_status)
+
+        # 打包期间每分钟在日志中记录一次剩余时间
+        self._last_remaining_seconds = 0
+        self._last_remaining_display = ""
+        self._remaining_log_timer = QTimer(self)
+        self._remaining_log_timer.setInterval(60000)
+        self._remaining_log_timer.timeout.connect(self._log_remaining_time)
+
+        # 打包开始时读取的配置快照
+        self._show_remaining = True
+        self._open_output_after_build = True
+
+        # 进行中的PyInstaller检查进程，以及已确认安装了PyInstaller的解释器
+        self._check_process: Optional[QProcess] = None
+        self._check_interpreter = ""
+        self._pyinstaller_checked = set()
+
+        # 智能建议/检测完成对话框（首次显示时构建，之后复用）
+        self._suggestions_dialog = None
+        self._detection_dialog = None
+
+        # 按标题复用的确认对话框
+        self._msg_boxes: Dict[str, QMessageBox] = {}
+
+        # 首次显示时再居中，此时窗口尺寸已确定
+        self._centered = False
 
         self.init_ui()
-        self.center_window()
-        self.connect_signals()
 
     def init_ui(self) -> None:
         """初始化用户界面"""
@@ -58,13 +293,11 @@ class MainWindow(QMainWindow):
         self.setMinimumSize(800, 1000)
 
         # 设置图标
-        if hasattr(self, 'setWindowIcon'):
-            try:
-                self.setWindowIcon(QIcon("icon.png"))
-            except:
-                pass
+        icon = self._get_app_icon()
+        if not icon.isNull():
+            self.setWindowIcon(icon)
 
-        # 创建菜单栏
+        # 创建菜单栏（首次显示前创建，避免显示后内容被菜单栏下推；关于对话框等在使用时才加载）
         self.menu_manager = MenuBarManager(self)
 
         # 创建中央部件
@@ -83,75 +316,155 @@ class MainWindow(QMainWindow):
         # 创建各个标签页
         self.create_tabs()
 
+    @classmethod
+    def _get_app_icon(cls) -> QIcon:
+        """获取应用图标（只加载一次，图标文件不存在时为空图标）"""
+        if cls._APP_ICON is None:
+            icon = QIcon()
+            if os.path.isfile("icon.png"):
+                icon.addFile("icon.png", QSize(32, 32))
+            cls._APP_ICON = icon
+        return cls._APP_ICON
+
     def create_tabs(self) -> None:
-        """创建标签页"""
-        # 基本设置标签页
-        self.basic_tab = BasicTab(self.model, self.config)
-        self.tab_widget.addTab(self.basic_tab, "基本设置")
+        """创建标签页
 
-        # 高级设置标签页
-        self.advanced_tab = AdvancedTab(self.model, self.config)
-        self.tab_widget.addTab(self.advanced_tab, "高级设置")
+        启动时只构建基本设置页，其余标签页先放置占位控件，首次切换到时再构建
+        """
+        # (属性名, 标题, 构造函数)
+        self._tab_specs = (
+            ("basic_tab", "基本设置", self._create_basic_tab),
+            ("advanced_tab", "高级设置", self._create_advanced_tab),
+            ("module_tab", "模块管理", self._create_module_tab),
+            ("settings_tab", "打包设置", self._create_settings_tab),
+            ("log_tab", "打包日志", self._create_log_tab),
+        )
+        for _, title, _ in self._tab_specs:
+            self.tab_widget.addTab(QWidget(), title)
+
+        self._materialize_tab(0)
+        self.tab_widget.currentChanged.connect(self._materialize_tab)
+        self.tab_widget.currentChanged.connect(self._on_current_tab_changed)
+
+    def _create_basic_tab(self) -> 'BasicTab':
+        """构建基本设置页"""
+        from views.tabs.basic_tab import BasicTab
+        tab = BasicTab(self.model, self.config)
+        tab.config_changed.connect(self.on_config_changed)
+        tab.script_selected.connect(self.on_script_selected)
+        return tab
+
+    def _create_advanced_tab(self) -> 'AdvancedTab':
+        """构建高级设置页"""
+        from views.tabs.advanced_tab import AdvancedTab
+        tab = AdvancedTab(self.model, self.config)
+        tab.config_changed.connect(self.on_config_changed)
+        return tab
+
+    def _create_module_tab(self) -> 'ModuleTab':
+        """构建模块管理页"""
+        from views.tabs.module_tab import ModuleTab
+        tab = ModuleTab(self.model, self.config, self.module_detector)
+        tab.silent_detection_finished.connect(self.on_silent_detection_finished)
+        return tab
+
+    def _create_settings_tab(self) -> 'SettingsTab':
+        """构建打包设置页"""
+        from views.tabs.settings_tab import SettingsTab
+        tab = SettingsTab(self.model, self.config)
+        tab.config_changed.connect(self.on_config_changed)
+        return tab
+
+    def _create_log_tab(self) -> 'LogTab':
+        """构建打包日志页"""
+        from views.tabs.log_tab import LogTab
+        tab = LogTab()
+        # 日志页创建前的配置变更没有生成预览，这里补上
+        self.on_config_changed()
+        return tab
 
-        # 模块管理标签页
-        self.module_tab = ModuleTab(self.model, self.config, self.module_detector)
-        self.tab_widget.addTab(self.module_tab, "模块管理")
+    @pyqtSlot(int)
+    def _on_current_tab_changed(self, index: int) -> None:
+        """切换到日志页时补上被推迟的命令预览和输出"""
+        if self.log_tab is None or self.tab_widget.widget(index) is not self.log_tab:
+            return
+        self._flush_log()
+        if self._preview_dirty:
+            self._do_update_preview()
 
-        # 打包设置标签页
-        self.settings_tab = SettingsTab(self.model, self.config)
-        self.tab_widget.addTab(self.settings_tab, "打包设置")
+    @pyqtSlot(int)
+    def _materialize_tab(self, index: int) -> None:
+        """构建指定位置的标签页（已构建则忽略）"""
+        if not 0 <= index < len(self._tab_specs):
+            return
+        name, title, factory = self._tab_specs[index]
+        if getattr(self, name) is not None:
+            return
 
-        # 打包日志标签页
-        self.log_tab = LogTab()
-        self.tab_widget.addTab(self.log_tab, "打包日志")
+        tab = factory()
+        setattr(self, name, tab)
+
+        # 用真实标签页替换占位控件，替换过程中不触发currentChanged
+        current = self.tab_widget.currentIndex()
+        placeholder = self.tab_widget.widget(index)
+        self.tab_widget.blockSignals(True)
+        self.tab_widget.removeTab(index)
+        self.tab_widget.insertTab(index, tab, title)
+        self.tab_widget.setCurrentIndex(current)
+        self.tab_widget.blockSignals(False)
+        placeholder.deleteLater()
+
+    def ensure_tab(self, name: str) -> QWidget:
+        """获取标签页，尚未构建时立即构建"""
+        for index, (tab_name, _, _) in enumerate(self._tab_specs):
+            if tab_name == name:
+                self._materialize_tab(index)
+                break
+        return getattr(self, name)
 
     def create_toolbar(self, layout: QVBoxLayout) -> None:
         """创建顶部工具栏"""
         # 创建工具栏容器
         toolbar_frame = QFrame()
+        toolbar_frame.setObjectName("toolbarFrame")
         toolbar_frame.setFrameStyle(QFrame.StyledPanel | QFrame.Raised)
         toolbar_frame.setLineWidth(1)
-        toolbar_frame.setStyleSheet("""
-            QFrame {
-                background-color: #f0f0f0;
-                border: 1px solid #d0d0d0;
-                border-radius: 3px;
-                margin: 2px;
-                padding: 4px;
-            }
-        """)
+        toolbar_frame.setStyleSheet(_TOOLBAR_QSS)
 
         toolbar_layout = QHBoxLayout(toolbar_frame)
         toolbar_layout.setContentsMargins(8, 6, 8, 6)
         toolbar_layout.setSpacing(8)
 
+        # 使用样式自带的图标，避免按钮文字中的 emoji 在每次重绘时走复杂排版和字体回退
+        style = self.style()
+
         # 生成命令按钮
-        self.generate_cmd_btn = QPushButton("🔧 生成命令")
+        self.generate_cmd_btn = QPushButton(style.standardIcon(QStyle.SP_CommandLink), "生成命令")
         self.generate_cmd_btn.clicked.connect(self.generate_command)
         self.generate_cmd_btn.setToolTip("根据当前配置生成PyInstaller命令")
-        self.generate_cmd_btn.setStyleSheet(self._get_button_style("#4CAF50"))
+        self.generate_cmd_btn.setObjectName("toolbarGenerateBtn")
         toolbar_layout.addWidget(self.generate_cmd_btn)
 
         # 开始打包按钮
-        self.start_package_btn = QPushButton("▶️ 开始打包")
+        self.start_package_btn = QPushButton(style.standardIcon(QStyle.SP_MediaPlay), "开始打包")
         self.start_package_btn.clicked.connect(self.start_package)
         self.start_package_btn.setToolTip("开始执行打包过程")
-        self.start_package_btn.setStyleSheet(self._get_button_style("#2196F3"))
+        self.start_package_btn.setObjectName("toolbarStartBtn")
         toolbar_layout.addWidget(self.start_package_btn)
 
         # 取消打包按钮
-        self.cancel_package_btn = QPushButton("⏹️ 取消打包")
+        self.cancel_package_btn = QPushButton(style.standardIcon(QStyle.SP_DialogCancelButton), "取消打包")
         self.cancel_package_btn.clicked.connect(self.cancel_package)
         self.cancel_package_btn.setEnabled(False)
         self.cancel_package_btn.setToolTip("取消正在进行的打包过程")
-        self.cancel_package_btn.setStyleSheet(self._get_button_style("#FF9800"))
+        self.cancel_package_btn.setObjectName("toolbarCancelBtn")
         toolbar_layout.addWidget(self.cancel_package_btn)
 
         # 清空配置按钮
-        self.clear_config_btn = QPushButton("🗑️ 清空配置")
+        self.clear_config_btn = QPushButton(style.standardIcon(QStyle.SP_DialogResetButton), "清空配置")
         self.clear_config_btn.clicked.connect(self.clear_config)
         self.clear_config_btn.setToolTip("清空所有配置项，恢复默认设置")
-        self.clear_config_btn.setStyleSheet(self._get_button_style("#f44336"))
+        self.clear_config_btn.setObjectName("toolbarClearBtn")
         toolbar_layout.addWidget(self.clear_config_btn)
 
         # 添加弹性空间，让按钮靠左对齐
@@ -159,98 +472,105 @@ class MainWindow(QMainWindow):
 
         # 添加状态指示器（可选）
         self.status_label = QLabel("就绪")
-        self.status_label.setStyleSheet("""
-            QLabel {
-                color: #666;
-                font-size: 12px;
-                padding: 4px 8px;
-                background-color: #e8e8e8;
-                border-radius: 10px;
-            }
-        """)
+        self.status_label.setObjectName("toolbarStatus")
         toolbar_layout.addWidget(self.status_label)
 
         layout.addWidget(toolbar_frame)
 
-    def _get_button_style(self, color: str) -> str:
-        """获取按钮样式"""
-        return f"""
-            QPushButton {{
-                background-color: {color};
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-weight: bold;
-                font-size: 13px;
-                min-width: 100px;
-            }}
-            QPushButton:hover {{
-                background-color: {self._darken_color(color)};
-            }}
-            QPushButton:pressed {{
-                background-color: {self._darken_color(color, 0.8)};
-            }}
-            QPushButton:disabled {{
-                background-color: #cccccc;
-                color: #666666;
-            }}
-        """
+    def _show_status(self, message: str, timeout: int = 0) -> None:
+        """显示状态栏消息（合并短时间内的多次更新，只显示最后一条；空消息表示清除）"""
+        self._pending_status = (message, timeout)
+        if not self._status_timer.isActive():
+            self._status_timer.start()
 
-    def _darken_color(self, color: str, factor: float = 0.9) -> str:
-        """使颜色变暗"""
-        # 简单的颜色变暗处理
-        color_map = {
-            "#4CAF50": "#45a049" if factor == 0.9 else "#3d8b40",
-            "#2196F3": "#1976D2" if factor == 0.9 else "#1565C0",
-            "#FF9800": "#F57C00" if factor == 0.9 else "#E65100",
-            "#f44336": "#d32f2f" if factor == 0.9 else "#c62828"
-        }
-        return color_map.get(color, color)
-
-    def connect_signals(self) -> None:
-        """连接信号槽"""
-        if self.basic_tab:
-            self.basic_tab.config_changed.connect(self.on_config_changed)
-            self.basic_tab.script_selected.connect(self.on_script_selected)
-        if self.advanced_tab:
-            self.advanced_tab.config_changed.connect(self.on_config_changed)
-        if self.settings_tab:
-            self.settings_tab.config_changed.connect(self.on_config_changed)
-        if self.module_tab:
-            self.module_tab.silent_detection_finished.connect(self.on_silent_detection_finished)
+    @pyqtSlot()
+    def _flush_status(self) -> None:
+        """将最后一条状态栏消息显示出来"""
+        if self._pending_status is None:
+            return
+        (message, timeout), self._pending_status = self._pending_status, None
+        if message:
+            self.statusBar().showMessage(message, timeout)
+        else:
+            self.statusBar().clearMessage()
+
+    def _ask(self, title: str, text: str) -> int:
+        """显示是/否确认对话框，同一标题的对话框只创建一次"""
+        box = self._msg_boxes.get(title)
+        if box is None:
+            box = QMessageBox(QMessageBox.Question, title, text, self._YES_NO, self)
+            self._msg_boxes[title] = box
+        else:
+            box.setText(text)
+        return box.exec_()
+
+    def showEvent(self, event) -> None:
+        """窗口显示事件"""
+        if not self._centered:
+            self._centered = True
+            self.center_window()
+        super().showEvent(event)
 
     def center_window(self) -> None:
         """窗口居中显示"""
-        desktop = QDesktopWidget()
-        screen = desktop.screenGeometry()
-        size = self.geometry()
-        self.move(
-            (screen.width() - size.width()) // 2,
-            (screen.height() - size.height()) // 2
-        )
+        screen = QApplication.primaryScreen().availableGeometry()
+        self.move(screen.center() - self.rect().center())
 
     @pyqtSlot()
     def on_config_changed(self) -> None:
         """配置变更处理"""
-        # 更新命令预览
-        if hasattr(self, 'log_tab') and self.log_tab:
-            python_interpreter = self.config.get("python_interpreter", "")
-            command = self.model.generate_command(python_interpreter)
-            self.log_tab.update_command_preview(command)
+        self._abs_output_dir = None
+
+        # 连续的变更合并为一次命令预览更新
+        self._cmd_preview_timer.start()
+
+    @pyqtSlot()
+    def _do_update_preview(self) -> None:
+        """更新命令预览"""
+        if self.log_tab:
+            # 日志页不可见时只做标记，切换到日志页时再生成
+            if self.tab_widget.currentWidget() is not self.log_tab:
+                self._preview_dirty = True
+                return
+            self._preview_dirty = False
+
+            # 影响命令的状态未变化时无需重新生成和刷新预览
+            key = self._command_state_key(self.config.get("python_interpreter", ""))
+            if key == self._last_cmd_key:
+                return
+
+            self.log_tab.update_command_preview(self._get_command(key))
+
+    def _get_command(self, key: tuple) -> str:
+        """获取打包命令，状态未变化时复用上次生成的命令"""
+        if key != self._last_cmd_key:
+            self._last_cmd = self.model.generate_command(key[0])
+            self._last_cmd_key = key
+        return self._last_cmd
+
+    def _command_state_key(self, python_interpreter: str) -> tuple:
+        """生成命令所依赖的状态（含脚本修改时间，脚本内容会影响智能检测参数）"""
+        model = self.model
+        try:
+            script_mtime = os.stat(model.script_path).st_mtime if model.script_path else None
+        except OSError:
+            script_mtime = None
+        return (python_interpreter, model.config_fingerprint(), script_mtime)
 
     @pyqtSlot(str)
     def on_script_selected(self, script_path: str) -> None:
         """脚本选择完成处理"""
-        self.statusBar().showMessage(f"正在分析脚本: {script_path}")
+        self._show_status(f"正在分析脚本: {script_path}")
+        self._invalidate_detection(script_path)
 
-        # 1. 自动进行智能超时建议
-        self._apply_smart_timeout_suggestion(script_path)
+        # 1. 自动进行智能超时建议（需要遍历项目目录，可在配置中关闭）
+        if self.config.get("timeout_auto_suggest", True):
+            self._apply_smart_timeout_suggestion(script_path)
 
         # 2. 自动开始模块检测（静默模式）
-        if self.module_tab and self.config.get("auto_detect_modules", True):
-            self.statusBar().showMessage("正在后台检测模块...")
-            self.module_tab.start_detection(silent=True)
+        if self.config.get("auto_detect_modules", True):
+            self._show_status("正在后台检测模块...")
+            self.ensure_tab("module_tab").start_detection(silent=True)
 
     @pyqtSlot(list, dict)
     def on_silent_detection_finished(self, modules: list, analysis: dict) -> None:
@@ -259,7 +579,7 @@ class MainWindow(QMainWindow):
         hidden_count = len(analysis.get('hidden_imports', []))
 
         # 更新状态栏
-        self.statusBar().showMessage(f"检测完成: 发现 {module_count} 个模块，推荐 {hidden_count} 个隐藏导入", 5000)
+        self._show_status(f"检测完成: 发现 {module_count} 个模块，推荐 {hidden_count} 个隐藏导入", 5000)
 
         # 显示优化的通知对话框
         if self.config.get("show_detection_notification", True):
@@ -268,79 +588,90 @@ class MainWindow(QMainWindow):
     def _apply_smart_timeout_suggestion(self, script_path: str) -> None:
         """应用智能超时建议"""
         try:
-            suggested_timeout = self.config.suggest_timeout_for_project(script_path)
-            current_timeout = self.config.get_package_timeout()
-
-            if suggested_timeout != current_timeout:
-                self.config.set_package_timeout(suggested_timeout)
-                timeout_text = self.config.format_timeout_display(suggested_timeout)
-                self.statusBar().showMessage(f"已自动设置超时时间: {timeout_text}", 3000)
-
-                # 如果设置标签页存在，刷新UI
-                if self.settings_tab:
-                    self.settings_tab.refresh_ui()
+            self._apply_suggested_timeout(self.config.suggest_timeout_for_project(script_path))
         except Exception as e:
             # 静默处理错误，不影响用户体验
-            print(f"智能超时建议失败: {e}")
+            logger.warning("智能超时建议失败: %s", e)
+
+    def _apply_suggested_timeout(self, suggested_timeout: int) -> None:
+        """将建议的超时时间写入配置并刷新界面"""
+        if suggested_timeout != self.config.get_package_timeout():
+            self.config.set_package_timeout(suggested_timeout)
+            timeout_text = self.config.format_timeout_display(suggested_timeout)
+            self._show_status(f"已自动设置超时时间: {timeout_text}", 3000)
+
+            # 如果设置标签页存在，刷新UI
+            if self.settings_tab:
+                self.settings_tab.refresh_ui()
 
     def _execute_pre_packaging_smart_suggestions(self) -> bool:
         """执行打包前的智能建议
 
+        分析在工作线程中进行，进度对话框以模态方式运行，期间界面保持响应
+
         Returns:
             bool: True表示继续打包，False表示用户取消
         """
-        from PyQt5.QtWidgets import QProgressDialog, QApplication
-        from PyQt5.QtCore import Qt
-
-        # 创建进度对话框
+        # 创建进度对话框（结果返回前不自动关闭）
         progress_dialog = QProgressDialog("正在执行智能分析...", "取消", 0, 100, self)
         progress_dialog.setWindowTitle("🧠 智能建议")
         progress_dialog.setWindowModality(Qt.WindowModal)
-        progress_dialog.setMinimumDuration(0)
+        progress_dialog.setAutoClose(False)
+        progress_dialog.setAutoReset(False)
         progress_dialog.setValue(0)
 
-        try:
-            # 1. 智能超时建议
-            progress_dialog.setLabelText("正在分析项目复杂度...")
-            progress_dialog.setValue(20)
-            QApplication.processEvents()
-
-            if progress_dialog.wasCanceled():
-                return False
-
-            self._apply_smart_timeout_suggestion(self.model.script_path)
-
-            # 2. 智能模块检测
-            progress_dialog.setLabelText("正在检测项目依赖...")
-            progress_dialog.setValue(40)
-            QApplication.processEvents()
-
-            if progress_dialog.wasCanceled():
-                return False
-
-            # 执行模块检测
-            detection_result = self._execute_smart_module_detection()
-
-            progress_dialog.setValue(80)
-            QApplication.processEvents()
-
-            if progress_dialog.wasCanceled():
-                return False
-
-            # 3. 显示结果并询问用户
-            progress_dialog.setLabelText("分析完成，准备显示结果...")
-            progress_dialog.setValue(100)
-            QApplication.processEvents()
-
-            progress_dialog.close()
+        cache_key = self._detection_cache_key(self.model.script_path)
+        worker = SmartSuggestionsWorker(
+            self.config, self.model.script_path,
+            self.config.get("python_interpreter", ""),
+            self._lookup_detection(cache_key)
+        )
+        outcome = {}
+
+        def on_progress(value: int, text: str) -> None:
+            if 'closed' not in outcome:
+                progress_dialog.setLabelText(text)
+                progress_dialog.setValue(value)
+
+        def on_finished(suggested_timeout: int, detection_result: dict) -> None:
+            if 'closed' not in outcome:
+                outcome['timeout'] = suggested_timeout
+                outcome['result'] = detection_result
+                progress_dialog.accept()
+
+        def on_failed(error: str) -> None:
+            if 'closed' not in outcome:
+                outcome['error'] = error
+                progress_dialog.accept()
+
+        worker.progress.connect(on_progress)
+        worker.analysis_finished.connect(on_finished)
+        worker.analysis_failed.connect(on_failed)
+        progress_dialog.canceled.connect(worker.requestInterruption)
+        worker.start()
+
+        # 对话框的事件循环驱动进度更新和取消，不再轮询processEvents()/wasCanceled()
+        progress_dialog.exec_()
+
+        # 取消后工作线程会在当前步骤结束时自行退出，之后到达的信号直接忽略
+        outcome['closed'] = True
+        progress_dialog.deleteLater()
+        if worker.isRunning():
+            # 保留引用直到线程结束，避免销毁运行中的QThread
+            _orphan_workers.add(worker)
+            worker.finished.connect(lambda w=worker: _orphan_workers.discard(w))
+
+        if 'error' in outcome:
+            QMessageBox.warning(self, "智能建议失败", f"执行智能建议时出错：{outcome['error']}\n\n将继续使用当前配置进行打包。")
+            return True  # 出错时继续打包
+        if 'result' not in outcome:
+            return False
 
-            # 显示智能建议结果对话框
-            return self._show_smart_suggestions_dialog(detection_result)
+        self._store_detection(cache_key, outcome['result'])
+        self._apply_suggested_timeout(outcome['timeout'])
 
-        except Exception as e:
-            progress_dialog.close()
-            QMessageBox.warning(self, "智能建议失败", f"执行智能建议时出错：{str(e)}\n\n将继续使用当前配置进行打包。")
-            return True  # 出错时继续打包
+        # 显示智能建议结果对话框
+        return self._show_smart_suggestions_dialog(outcome['result'])
 
     def _execute_smart_module_detection(self) -> dict:
         """执行智能模块检测
@@ -348,45 +679,42 @@ class MainWindow(QMainWindow):
         Returns:
             dict: 检测结果
         """
+        cache_key = self._detection_cache_key(self.model.script_path)
+        result = self._lookup_detection(cache_key)
+        if result is None:
+            result = _detect_script_modules(self.model.script_path, self.config.get("python_interpreter", ""))
+            self._store_detection(cache_key, result)
+        return result
+
+    def _detection_cache_key(self, script_path: str) -> Optional[tuple]:
+        """生成检测缓存键，脚本不存在时返回None"""
         try:
-            # 尝试使用性能优化检测器
-            try:
-                from services.performance_optimized_detector import PerformanceOptimizedDetector
-                detector = PerformanceOptimizedDetector(
-                    python_interpreter=self.config.get("python_interpreter", ""),
-                    timeout=30  # 30秒超时，避免阻塞太久
-                )
-                result = detector.detect_modules(self.model.script_path)
-                return {
-                    'modules': result.recommended_modules,
-                    'hidden_imports': result.hidden_imports,
-                    'analysis': result
-                }
-            except ImportError:
-                # 回退到智能分析器
-                from services.intelligent_module_analyzer import IntelligentModuleAnalyzer
-                analyzer = IntelligentModuleAnalyzer(
-                    python_interpreter=self.config.get("python_interpreter", ""),
-                    timeout=30
-                )
-                result = analyzer.analyze_script(
-                    script_path=self.model.script_path,
-                    use_execution=False,  # 快速模式
-                    enable_ml_scoring=False
-                )
-                return {
-                    'modules': result.recommended_modules,
-                    'hidden_imports': result.hidden_imports,
-                    'analysis': result
-                }
-        except Exception as e:
-            # 如果检测失败，返回空结果
-            return {
-                'modules': [],
-                'hidden_imports': [],
-                'analysis': None,
-                'error': str(e)
-            }
+            stat = os.stat(script_path)
+        except (OSError, TypeError, ValueError):
+            return None
+        return (script_path, stat.st_mtime, stat.st_size, self.config.get("python_interpreter", ""))
+
+    def _lookup_detection(self, key: Optional[tuple]) -> Optional[dict]:
+        """查找缓存的检测结果"""
+        if key is None or key not in self._detection_cache:
+            return None
+        self._detection_cache.move_to_end(key)
+        return self._detection_cache[key]
+
+    def _store_detection(self, key: Optional[tuple], result: dict) -> None:
+        """缓存检测结果（检测失败的结果不缓存）"""
+        if key is None or 'error' in result:
+            return
+        self._detection_cache[key] = result
+        self._detection_cache.move_to_end(key)
+        while len(self._detection_cache) > _DETECTION_CACHE_SIZE:
+            self._detection_cache.popitem(last=False)
+
+    def _invalidate_detection(self, script_path: str) -> None:
+        """移除脚本已过期的检测结果"""
+        current = self._detection_cache_key(script_path)
+        for key in [k for k in self._detection_cache if k[0] == script_path and k != current]:
+            del self._detection_cache[key]
 
     def _show_smart_suggestions_dialog(self, detection_result: dict) -> bool:
         """显示智能建议对话框
@@ -397,9 +725,23 @@ class MainWindow(QMainWindow):
         Returns:
             bool: True表示继续打包，False表示取消
         """
-        from PyQt5.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTextEdit, QCheckBox
-        from PyQt5.QtCore import Qt
+        # 对话框只构建一次，之后只更新结果文本和选项
+        if self._suggestions_dialog is None:
+            self._suggestions_dialog = self._create_smart_suggestions_dialog()
+        self._suggestions_result_text.setPlainText(self._build_suggestions_content(detection_result))
+        self._suggestions_auto_apply.setChecked(True)
 
+        # 显示对话框并处理结果
+        result = self._suggestions_dialog.exec_()
+
+        if result == _SuggestionsResult.APPLY:
+            if self._suggestions_auto_apply.isChecked():
+                self._apply_detection_suggestions(detection_result)
+            return True
+        return result == _SuggestionsResult.SKIP
+
+    def _create_smart_suggestions_dialog(self):
+        """构建智能建议对话框（结果文本由调用方填充）"""
         dialog = QDialog(self)
         dialog.setWindowTitle("🧠 智能建议 - 打包前检查")
         dialog.setMinimumSize(700, 500)
@@ -461,10 +803,6 @@ class MainWindow(QMainWindow):
             }
         """)
 
-        # 构建结果文本
-        result_content = self._build_suggestions_content(detection_result)
-        result_text.setPlainText(result_content)
-
         result_layout.addWidget(result_text)
         layout.addWidget(result_frame)
 
@@ -482,7 +820,7 @@ class MainWindow(QMainWindow):
 
         skip_btn = QPushButton("⏭️ 跳过建议，直接打包")
         skip_btn.setStyleSheet("QPushButton { background-color: #FF9800; color: white; padding: 8px 16px; }")
-        skip_btn.clicked.connect(lambda: dialog.done(2))  # 返回特殊值2表示跳过
+        skip_btn.clicked.connect(lambda: dialog.done(_SuggestionsResult.SKIP))
 
         cancel_btn = QPushButton("❌ 取消打包")
         cancel_btn.clicked.connect(dialog.reject)
@@ -492,17 +830,9 @@ class MainWindow(QMainWindow):
         button_layout.addWidget(cancel_btn)
         layout.addLayout(button_layout)
 
-        # 显示对话框并处理结果
-        result = dialog.exec_()
-
-        if result == QDialog.Accepted:  # 应用建议并继续
-            if auto_apply_checkbox.isChecked():
-                self._apply_detection_suggestions(detection_result)
-            return True
-        elif result == 2:  # 跳过建议，直接打包
-            return True
-        else:  # 取消打包
-            return False
+        self._suggestions_result_text = result_text
+        self._suggestions_auto_apply = auto_apply_checkbox
+        return dialog
 
     def _build_suggestions_content(self, detection_result: dict) -> str:
         """构建建议内容文本"""
@@ -543,43 +873,57 @@ class MainWindow(QMainWindow):
         try:
             hidden_imports = detection_result.get('hidden_imports', [])
 
-            if hidden_imports and self.module_tab:
+            if hidden_imports:
                 # 将隐藏导入添加到模块标签页
-                for imp in hidden_imports:
-                    self.module_tab.add_hidden_import(imp)
+                self.ensure_tab("module_tab").add_hidden_imports(hidden_imports)
 
                 # 更新状态栏
-                self.statusBar().showMessage(f"已自动添加 {len(hidden_imports)} 个隐藏导入", 3000)
+                self._show_status(f"已自动添加 {len(hidden_imports)} 个隐藏导入", 3000)
 
         except Exception as e:
-            print(f"应用检测建议失败: {e}")
+            logger.warning("应用检测建议失败: %s", e)
 
     def _show_detection_completion_dialog(self, module_count: int, hidden_count: int, analysis: dict) -> None:
         """显示检测完成对话框"""
-        from PyQt5.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QCheckBox
-
-        dialog = QDialog(self)
-        dialog.setWindowTitle("模块检测完成")
-        dialog.setMinimumSize(400, 200)
-
-        layout = QVBoxLayout(dialog)
+        # 对话框只构建一次，之后只更新统计信息
+        if self._detection_dialog is None:
+            self._detection_dialog = self._create_detection_completion_dialog()
 
-        # 主要信息
-        info_label = QLabel(
+        self._detection_info_label.setText(
             f"✅ 自动检测完成！\n\n"
             f"• 发现模块: {module_count} 个\n"
             f"• 推荐隐藏导入: {hidden_count} 个\n"
             f"• 已自动应用到配置中"
         )
-        info_label.setStyleSheet("font-size: 12px; padding: 10px;")
-        layout.addWidget(info_label)
 
         # 框架信息（如果有）
         if 'framework_configs' in analysis and analysis['framework_configs']:
             frameworks = list(analysis['framework_configs'].keys())
-            framework_label = QLabel(f"🔍 检测到框架: {', '.join(frameworks)}")
-            framework_label.setStyleSheet("color: #2196F3; font-weight: bold;")
-            layout.addWidget(framework_label)
+            self._detection_framework_label.setText(f"🔍 检测到框架: {', '.join(frameworks)}")
+            self._detection_framework_label.show()
+        else:
+            self._detection_framework_label.hide()
+
+        self.dont_show_checkbox.setChecked(False)
+        self._detection_dialog.exec_()
+
+    def _create_detection_completion_dialog(self):
+        """构建检测完成对话框（统计信息由调用方填充）"""
+        dialog = QDialog(self)
+        dialog.setWindowTitle("模块检测完成")
+        dialog.setMinimumSize(400, 200)
+
+        layout = QVBoxLayout(dialog)
+
+        # 主要信息
+        self._detection_info_label = QLabel()
+        self._detection_info_label.setStyleSheet("font-size: 12px; padding: 10px;")
+        layout.addWidget(self._detection_info_label)
+
+        # 框架信息
+        self._detection_framework_label = QLabel()
+        self._detection_framework_label.setStyleSheet("color: #2196F3; font-weight: bold;")
+        layout.addWidget(self._detection_framework_label)
 
         # 选项
         options_layout = QVBoxLayout()
@@ -607,14 +951,13 @@ class MainWindow(QMainWindow):
 
         layout.addLayout(button_layout)
 
-        dialog.exec_()
+        return dialog
 
     def _show_module_details(self, parent_dialog) -> None:
         """显示模块详细信息"""
         parent_dialog.accept()  # 关闭通知对话框
         # 切换到模块管理标签页
-        if self.module_tab:
-            self.tab_widget.setCurrentWidget(self.module_tab)
+        self.tab_widget.setCurrentWidget(self.ensure_tab("module_tab"))
 
     def _close_detection_dialog(self, dialog) -> None:
         """关闭检测对话框"""
@@ -626,10 +969,9 @@ class MainWindow(QMainWindow):
     @pyqtSlot()
     def generate_command(self) -> None:
         """生成打包命令"""
-        python_interpreter = self.config.get("python_interpreter", "")
-        command = self.model.generate_command(python_interpreter)
-        if command and self.log_tab:
-            self.log_tab.update_command_preview(command)
+        command = self._get_command(self._command_state_key(self.config.get("python_interpreter", "")))
+        if command:
+            self.ensure_tab("log_tab").update_command_preview(command)
             QMessageBox.information(self, "命令生成", "打包命令已生成，请查看日志标签页")
         else:
             QMessageBox.warning(self, "错误", "无法生成打包命令，请检查配置")
@@ -642,38 +984,87 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "错误", "请选择要打包的Python脚本")
             return
 
-        # 检查PyInstaller
-        if self.controller and not self.controller.check_pyinstaller_installation():
-            python_interpreter = self.config.get("python_interpreter", "")
+        # 检查PyInstaller（在子进程中异步检查，完成后继续打包流程）
+        python_interpreter = self.config.get("python_interpreter", "")
+        if self.controller and python_interpreter not in self._pyinstaller_checked:
+            self._start_pyinstaller_check(python_interpreter)
+            return
+
+        self._continue_start_package()
+
+    def _start_pyinstaller_check(self, python_interpreter: str) -> None:
+        """启动PyInstaller安装检查"""
+        if self._check_process is not None:
+            return  # 已有检查在进行
+
+        # 由controller按当前配置创建检查进程，这里只负责异步等待结果
+        process = self.controller.create_pyinstaller_check_process(self)
+        process.finished.connect(self._on_pyinstaller_check_finished)
+        process.errorOccurred.connect(self._on_pyinstaller_check_error)
+        self._check_process = process
+        self._check_interpreter = python_interpreter
+
+        self.start_package_btn.setEnabled(False)
+        self._show_status("正在检查PyInstaller...")
+        process.start()
+        # 最多等待10秒，超时结束进程（随后触发finished）
+        QTimer.singleShot(10000, lambda: self._check_process is process and process.kill())
+
+    @pyqtSlot(int, QProcess.ExitStatus)
+    def _on_pyinstaller_check_finished(self, exit_code: int, exit_status: QProcess.ExitStatus) -> None:
+        """PyInstaller检查进程结束"""
+        self._finish_pyinstaller_check(exit_status == QProcess.NormalExit and exit_code == 0)
+
+    @pyqtSlot(QProcess.ProcessError)
+    def _on_pyinstaller_check_error(self, error: QProcess.ProcessError) -> None:
+        """PyInstaller检查进程无法启动（其他错误会随后触发finished）"""
+        if error == QProcess.FailedToStart:
+            self._finish_pyinstaller_check(False)
+
+    def _finish_pyinstaller_check(self, installed: bool) -> None:
+        """处理PyInstaller检查结果"""
+        process, self._check_process = self._check_process, None
+        if process is None:
+            return
+        process.deleteLater()
+        self.start_package_btn.setEnabled(True)
+        self._show_status("")
+
+        python_interpreter = self._check_interpreter
+        if not installed:
+            # 检查失败时不保留缓存，下次打包（例如安装之后）重新检查
+            self._pyinstaller_checked.discard(python_interpreter)
             env_info = f"在环境 {python_interpreter}" if python_interpreter else "在当前环境"
-            reply = QMessageBox.question(
-                self, "PyInstaller未安装",
-                f"PyInstaller{env_info}中未安装，是否现在安装？",
-                QMessageBox.Yes | QMessageBox.No
-            )
+            reply = self._ask("PyInstaller未安装", f"PyInstaller{env_info}中未安装，是否现在安装？")
             if reply == QMessageBox.Yes:
                 self.install_pyinstaller()
             return
 
+        # 同一解释器本次会话内不再重复检查
+        self._pyinstaller_checked.add(python_interpreter)
+        self._continue_start_package()
+
+    def _continue_start_package(self) -> None:
+        """PyInstaller检查通过后继续打包流程"""
         # 🧠 自动执行打包前智能建议（新增功能）
         if self.config.get("auto_smart_suggestions_before_packaging", True):
             if not self._execute_pre_packaging_smart_suggestions():
                 return  # 用户取消了打包
 
         # 切换到日志标签页
-        self.tab_widget.setCurrentWidget(self.log_tab)
+        self.tab_widget.setCurrentWidget(self.ensure_tab("log_tab"))
 
-        # 清空上一次的打包日志
-        if self.log_tab:
-            self.log_tab.clear_log()
-
-        # 切换到日志标签页
-        self.tab_widget.setCurrentWidget(self.log_tab)
+        # 清空上一次的打包日志并进入打包状态
+        self.log_tab.reset_for_new_build("正在启动异步打包服务...")
 
         # 创建增强的异步打包服务
         python_interpreter = self.config.get("python_interpreter", "")
         timeout = self.config.get("package_timeout", 300)  # 默认5分钟超时
 
+        # 打包期间频繁使用的配置项在开始时读取一次
+        self._show_remaining = self.config.get("timeout_show_remaining", True)
+        self._open_output_after_build = self.config.get("open_output_after_build", True)
+
         self.async_package_service = AsyncPackageService(
             self.model,
             python_interpreter,
@@ -695,13 +1086,13 @@ class MainWindow(QMainWindow):
         self.start_package_btn.setEnabled(False)
         self.cancel_package_btn.setEnabled(True)
 
-        # 启动打包UI状态
-        self.log_tab.start_packaging_ui()
-
         # 开始异步打包
-        self.log_tab.append_log("正在启动异步打包服务...")
         if self.async_package_service.start_packaging():
             self.log_tab.append_log("✅ 异步打包任务已成功启动")
+            if self._show_remaining:
+                self._last_remaining_seconds = 0
+                self._last_remaining_display = ""
+                self._remaining_log_timer.start()
         else:
             self.log_tab.append_log("❌ 启动打包任务失败")
             self.on_package_finished(False, "启动打包任务失败")
@@ -709,6 +1100,7 @@ class MainWindow(QMainWindow):
     @pyqtSlot()
     def cancel_package(self) -> None:
         """取消打包"""
+        self._flush_log()  # 保持与缓冲输出的先后顺序
         if self.async_package_service:
             self.async_package_service.cancel_packaging()
             self.log_tab.cancel_packaging_ui()
@@ -725,11 +1117,34 @@ class MainWindow(QMainWindow):
     def on_output_received(self, output: str) -> None:
         """输出接收处理"""
         # 确保所有输出都显示在日志中
-        self.log_tab.append_log(output)
+        self._enqueue_log(output)
+
+    @pyqtSlot(str)
+    def _enqueue_log(self, line: str) -> None:
+        """缓冲一行输出，由定时器批量写入日志页"""
+        self._log_buf.append(line)
+        if self.tab_widget.currentWidget() is not self.log_tab:
+            return  # 切换到日志页时再写入
+        if len(self._log_buf) >= _LOG_BUF_MAX_LINES:
+            self._flush_log()
+        elif not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+
+    @pyqtSlot()
+    def _flush_log(self) -> None:
+        """将缓冲的输出一次性写入日志页"""
+        self._log_flush_timer.stop()
+        if not self._log_buf:
+            return
+        lines = list(self._log_buf)
+        self._log_buf.clear()
+        # 只追加文本，重绘交给Qt合并处理；这里不要调用repaint()或processEvents()
+        self.log_tab.append_logs(lines)
 
     @pyqtSlot(str)
     def on_error_occurred(self, error_message: str) -> None:
         """错误发生处理"""
+        self._flush_log()  # 保持与缓冲输出的先后顺序
         self.log_tab.log_error(error_message)
 
     @pyqtSlot(str)
@@ -742,7 +1157,7 @@ class MainWindow(QMainWindow):
         """处理全局异常"""
         try:
             # 记录异常到日志
-            self.log_tab.log_error(f"全局异常: {error_type}: {error_message}")
+            self.ensure_tab("log_tab").log_error(f"全局异常: {error_type}: {error_message}")
 
             # 收集上下文信息
             context = {
@@ -791,14 +1206,23 @@ class MainWindow(QMainWindow):
     @pyqtSlot(int)
     def on_remaining_time_updated(self, remaining_seconds: int):
         """剩余时间更新处理"""
-        if self.config.get("timeout_show_remaining", True):
-            display_time = self.config.format_timeout_display(remaining_seconds)
-            status_msg = f"剩余时间: {display_time}"
-            self.log_tab.set_progress_text(status_msg)
+        if not self._show_remaining or remaining_seconds == self._last_remaining_seconds:
+            return
+        self._last_remaining_seconds = remaining_seconds
 
-            # 在日志中显示剩余时间（每分钟显示一次）
-            if remaining_seconds % 60 == 0 and remaining_seconds > 0:
-                self.log_tab.log_info(f"⏰ 打包剩余时间: {display_time}")
+        # 显示文本未变化时（如超过1小时只精确到分钟）不刷新进度标签
+        display_time = self.config.format_timeout_display(remaining_seconds)
+        if display_time != self._last_remaining_display:
+            self._last_remaining_display = display_time
+            self.log_tab.set_progress_text(f"剩余时间: {display_time}")
+
+    @pyqtSlot()
+    def _log_remaining_time(self) -> None:
+        """在日志中显示剩余时间（由每分钟触发的定时器调用）"""
+        if self._last_remaining_seconds > 0:
+            display_time = self.config.format_timeout_display(self._last_remaining_seconds)
+            self._flush_log()
+            self.log_tab.log_info(f"⏰ 打包剩余时间: {display_time}")
 
     @pyqtSlot(int)
     def on_timeout_warning(self, remaining_seconds: int):
@@ -807,91 +1231,95 @@ class MainWindow(QMainWindow):
         warning_msg = f"⚠️ 超时警告: 剩余时间仅 {display_time}，请耐心等待或考虑增加超时时间"
 
         # 在日志中显示警告
+        self._flush_log()
         self.log_tab.log_warning(warning_msg)
 
-        # 可选：显示系统通知（如果支持）
-        try:
-            from PyQt5.QtWidgets import QSystemTrayIcon
-            if QSystemTrayIcon.isSystemTrayAvailable():
-                # 这里可以添加系统托盘通知
-                pass
-        except ImportError:
-            pass
-
     @pyqtSlot(bool, str)
     def on_package_finished(self, success: bool, message: str) -> None:
         """打包完成处理"""
+        self._remaining_log_timer.stop()
+
         # 恢复按钮状态
         self.start_package_btn.setEnabled(True)
         self.cancel_package_btn.setEnabled(False)
 
         # 更新UI状态
+        self._flush_log()
         self.log_tab.finish_packaging_ui(success, message)
 
         if success:
-            if self.config.get("open_output_after_build", True):
+            if self._open_output_after_build:
                 self.open_output_folder()
             QMessageBox.information(self, "成功", "打包完成！")
         else:
             QMessageBox.critical(self, "失败", f"打包失败: {message}")
 
+    @pyqtSlot()
     def install_pyinstaller(self) -> None:
-        """安装PyInstaller"""
-        self.tab_widget.setCurrentWidget(self.log_tab)
-        if self.controller:
-            success = self.controller.install_pyinstaller(self.log_tab.append_log)
-        else:
-            # 如果没有controller，使用默认方式安装
-            success = PyInstallerChecker.install_pyinstaller(self.log_tab.append_log)
+        """安装PyInstaller（在后台线程中执行，界面保持响应）"""
+        if self._install_worker is not None and self._install_worker.isRunning():
+            return
+
+        self.tab_widget.setCurrentWidget(self.ensure_tab("log_tab"))
+        self.start_package_btn.setEnabled(False)
+
+        python_interpreter = self.config.get("python_interpreter", "")
+        # 有controller时仍由controller执行安装，只是放到后台线程中
+        installer = self.controller.install_pyinstaller if self.controller else None
+        self._install_worker = PyInstallerInstallWorker(python_interpreter, installer)
+        self._install_worker.output_received.connect(self._enqueue_log, Qt.QueuedConnection)
+        self._install_worker.install_finished.connect(self._on_install_finished, Qt.QueuedConnection)
+        self._install_worker.start()
+
+    @pyqtSlot(bool)
+    def _on_install_finished(self, success: bool) -> None:
+        """PyInstaller安装完成处理"""
+        self._flush_log()
+        worker, self._install_worker = self._install_worker, None
+        if worker is not None and worker.isRunning():
+            # 保留引用直到线程结束，避免销毁运行中的QThread
+            _orphan_workers.add(worker)
+            worker.finished.connect(lambda w=worker: _orphan_workers.discard(w))
+        self.start_package_btn.setEnabled(True)
 
         if success:
             QMessageBox.information(self, "成功", "PyInstaller安装成功！")
         else:
             QMessageBox.critical(self, "失败", "PyInstaller安装失败！")
 
+    @pyqtSlot()
     def open_output_folder(self) -> None:
         """打开输出文件夹"""
-        output_dir = self.model.output_dir
-
-        # 转换为绝对路径
-        abs_output_dir = os.path.abspath(output_dir)
-
-        # 检查目录是否存在
-        if not os.path.exists(abs_output_dir):
-            # 如果目录不存在，尝试创建它
-            try:
-                os.makedirs(abs_output_dir, exist_ok=True)
-            except Exception as e:
-                QMessageBox.warning(
-                    self,
-                    "警告",
-                    f"无法创建输出目录：{abs_output_dir}\n错误：{str(e)}"
-                )
-                return
+        output_dir = os.fspath(self.model.output_dir)
 
-        # 打开文件夹
+        # 转换为绝对路径（输出目录未变化时复用上次结果）
+        if self._abs_output_dir is None or self._abs_output_dir[0] != output_dir:
+            self._abs_output_dir = (output_dir, os.path.abspath(output_dir))
+        abs_output_dir = self._abs_output_dir[1]
+
+        # 确保目录存在（目录已存在时makedirs不做任何事）
         try:
-            system = platform.system()
-            if system == "Windows":
-                os.startfile(abs_output_dir)
-            elif system == "Darwin":  # macOS
-                subprocess.run(["open", abs_output_dir])
-            else:  # Linux
-                subprocess.run(["xdg-open", abs_output_dir])
+            os.makedirs(abs_output_dir, exist_ok=True)
         except Exception as e:
             QMessageBox.warning(
                 self,
                 "警告",
-                f"无法打开输出文件夹：{abs_output_dir}\n错误：{str(e)}\n\n您可以手动打开此路径。"
+                f"无法创建输出目录：{abs_output_dir}\n错误：{str(e)}"
+            )
+            return
+
+        # 打开文件夹（由系统文件管理器异步打开，不阻塞界面）
+        if not QDesktopServices.openUrl(QUrl.fromLocalFile(abs_output_dir)):
+            QMessageBox.warning(
+                self,
+                "警告",
+                f"无法打开输出文件夹：{abs_output_dir}\n\n您可以手动打开此路径。"
             )
 
     @pyqtSlot()
     def clear_config(self) -> None:
         """清空配置"""
-        reply = QMessageBox.question(
-            self, "确认", "确定要清空所有配置吗？",
-            QMessageBox.Yes | QMessageBox.No
-        )
+        reply = self._ask("确认", "确定要清空所有配置吗？")
         if reply == QMessageBox.Yes:
             self.model.reset_to_defaults()
             # 刷新所有标签页
@@ -911,8 +1339,20 @@ class MainWindow(QMainWindow):
         self.config.save_config()
 
         # 取消正在进行的打包
+        running = None
         if self.package_service and self.package_service.isRunning():
             self.package_service.cancel()
-            self.package_service.wait(3000)  # 等待3秒
+            running = self.package_service
+        elif self.async_package_service and self.async_package_service.is_running():
+            self.async_package_service.cancel_packaging()
+            running = self.async_package_service.worker
+
+        if running is not None:
+            # 最多等待3秒：打包进程的 finished 信号或超时结束等待，期间事件循环继续运行
+            loop = QEventLoop()
+            running.finished.connect(loop.quit)
+            QTimer.singleShot(3000, loop.quit)
+            if running.isRunning():
+                loop.exec_()
 
         event.accept()
\ No newline at end of file
@@ -5,11 +5,39 @@
 菜单栏管理器
 """
 
-import webbrowser
+import os
 from PyQt5.QtWidgets import QAction, QMessageBox, QFileDialog
-from PyQt5.QtCore import pyqtSlot
-from PyQt5.QtGui import QKeySequence
-from about_dialog import AboutDialog
+from PyQt5.QtCore import QUrl, pyqtSlot
+from PyQt5.QtGui import QDesktopServices, QKeySequence
+
+
+def _load_project_file(file_path: str) -> dict:
+    """读取项目配置文件，安装了 orjson 时用它解析"""
+    try:
+        import orjson
+    except ImportError:
+        import json
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    with open(file_path, 'rb') as f:
+        return orjson.loads(f.read())
+
+
+def _dump_project_file(file_path: str, config_data: dict) -> None:
+    """写入项目配置文件，安装了 orjson 时用它序列化
+
+    两种方式输出相同的格式：2空格缩进（orjson 只支持2空格），非ASCII字符不转义
+    """
+    try:
+        import orjson
+    except ImportError:
+        import json
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(config_data, f, indent=2, ensure_ascii=False)
+        return
+    with open(file_path, 'wb') as f:
+        f.write(orjson.dumps(config_data, option=orjson.OPT_INDENT_2))
+
 class MenuBarManager:
     """菜单栏管理器"""
 
@@ -173,14 +201,13 @@ class MenuBarManager:
     def open_project(self, checked=False) -> None:
         """打开项目"""
         file_path, _ = QFileDialog.getOpenFileName(
-            self.main_window, "打开项目配置", "",
+            self.main_window, "打开项目配置", self.main_window.config.get_last_dir("project"),
             "JSON文件 (*.json);;所有文件 (*)"
         )
         if file_path:
+            self.main_window.config.set_last_dir("project", os.path.dirname(file_path))
             try:
-                import json
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    config_data = json.load(f)
+                config_data = _load_project_file(file_path)
                 
                 # 加载配置到模型
                 self.main_window.model.from_dict(config_data)
@@ -200,7 +227,7 @@ class MenuBarManager:
     def save_project(self, checked=False) -> None:
         """保存项目"""
         file_path, _ = QFileDialog.getSaveFileName(
-            self.main_window, "保存项目配置", "project_config.json",
+            self.main_window, "保存项目配置", self._default_project_path(),
             "JSON文件 (*.json);;所有文件 (*)"
         )
         if file_path:
@@ -209,19 +236,22 @@ class MenuBarManager:
     def save_project_as(self, checked=False) -> None:
         """另存为项目"""
         file_path, _ = QFileDialog.getSaveFileName(
-            self.main_window, "另存为项目配置", "project_config.json",
+            self.main_window, "另存为项目配置", self._default_project_path(),
             "JSON文件 (*.json);;所有文件 (*)"
         )
         if file_path:
             self._save_project_to_file(file_path)
     
+    def _default_project_path(self) -> str:
+        """保存项目时的默认路径（上次使用的目录）"""
+        return os.path.join(self.main_window.config.get_last_dir("project"), "project_config.json")
+
     def _save_project_to_file(self, file_path: str) -> None:
         """保存项目到文件"""
+        self.main_window.config.set_last_dir("project", os.path.dirname(file_path))
         try:
-            import json
             config_data = self.main_window.model.to_dict()
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(config_data, f, indent=4, ensure_ascii=False)
+            _dump_project_file(file_path, config_data)
             QMessageBox.information(self.main_window, "成功", f"项目配置已保存到: {file_path}")
         except Exception as e:
             QMessageBox.critical(self.main_window, "错误", f"保存项目配置失败: {str(e)}")
@@ -259,9 +289,9 @@ class MenuBarManager:
             return
         
         # 切换到模块标签页
-        if self.main_window.module_tab:
-            self.main_window.tab_widget.setCurrentWidget(self.main_window.module_tab)
-            self.main_window.module_tab.start_detection()
+        module_tab = self.main_window.ensure_tab("module_tab")
+        self.main_window.tab_widget.setCurrentWidget(module_tab)
+        module_tab.start_detection()
     
     def show_help(self, checked=False) -> None:
         """显示帮助"""
@@ -298,17 +328,18 @@ PyInstaller打包工具使用说明
 
     def open_pyinstaller_docs(self, checked=False) -> None:
         """打开PyInstaller文档"""
-        webbrowser.open("https://pyinstaller.readthedocs.io/")
+        QDesktopServices.openUrl(QUrl("https://pyinstaller.readthedocs.io/"))
 
     def open_homepage(self, checked=False) -> None:
         """打开项目首页"""
-        webbrowser.open("https://github.com/shuairongzeng/mc-pyinstaller-gui")
+        QDesktopServices.openUrl(QUrl("https://github.com/shuairongzeng/mc-pyinstaller-gui"))
 
     def report_issue(self, checked=False) -> None:
         """报告问题"""
-        webbrowser.open("https://github.com/shuairongzeng/mc-pyinstaller-gui/issues")
+        QDesktopServices.openUrl(QUrl("https://github.com/shuairongzeng/mc-pyinstaller-gui/issues"))
 
     def show_about(self, checked=False) -> None:
         """显示关于对话框"""
+        from about_dialog import AboutDialog
         about_dialog = AboutDialog(self.main_window)
         about_dialog.exec_()
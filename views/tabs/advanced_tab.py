@@ -7,7 +7,7 @@ from PyQt5.QtWidgets import (
     QLabel, QLineEdit, QPushButton, QFileDialog, QCheckBox, 
     QComboBox, QTextEdit, QMessageBox
 )
-from PyQt5.QtCore import pyqtSignal, pyqtSlot
+from PyQt5.QtCore import QSignalBlocker, pyqtSignal, pyqtSlot
 
 from config.app_config import AppConfig
 from models.packer_model import PyInstallerModel
@@ -167,8 +167,9 @@ class AdvancedTab(QWidget):
     def browse_upx_dir(self) -> None:
         """浏览UPX目录"""
         from PyQt5.QtWidgets import QFileDialog
-        dir_path = QFileDialog.getExistingDirectory(self, "选择UPX目录")
+        dir_path = QFileDialog.getExistingDirectory(self, "选择UPX目录", self.config.get_last_dir("upx"))
         if dir_path:
+            self.config.set_last_dir("upx", dir_path)
             self.upx_dir_edit.setText(dir_path)
     
     @pyqtSlot(str)
@@ -236,22 +237,33 @@ class AdvancedTab(QWidget):
     
     def refresh_ui(self) -> None:
         """刷新界面"""
-        # 更新基本选项
-        self.name_edit.setText(self.model.name)
-        self.contents_dir_edit.setText(self.model.contents_directory)
-        self.clean_checkbox.setChecked(self.model.clean)
-        if self.model.log_level:
-            self.log_level_combo.setCurrentText(self.model.log_level)
-        
-        # 更新UPX选项
-        self.upx_checkbox.setChecked(self.model.enable_upx)
-        self.upx_dir_edit.setText(self.model.upx_dir)
-        
-        # 更新模块选项
-        if self.model.hidden_imports:
-            self.hidden_imports_edit.setText(','.join(self.model.hidden_imports))
-        self.exclude_modules_edit.setText(self.model.exclude_module)
-        self.paths_edit.setText(self.model.paths)
-        
-        # 更新附加参数
-        self.additional_args_edit.setPlainText(self.model.additional_args)
+        # 控件值来自模型，刷新期间屏蔽各控件的变更信号，结束后只发一次配置变更
+        blockers = [QSignalBlocker(widget) for widget in (
+            self.name_edit, self.contents_dir_edit, self.clean_checkbox, self.log_level_combo,
+            self.upx_checkbox, self.upx_dir_edit, self.hidden_imports_edit,
+            self.exclude_modules_edit, self.paths_edit, self.additional_args_edit
+        )]
+        try:
+            # 更新基本选项
+            self.name_edit.setText(self.model.name)
+            self.contents_dir_edit.setText(self.model.contents_directory)
+            self.clean_checkbox.setChecked(self.model.clean)
+            if self.model.log_level:
+                self.log_level_combo.setCurrentText(self.model.log_level)
+
+            # 更新UPX选项
+            self.upx_checkbox.setChecked(self.model.enable_upx)
+            self.upx_dir_edit.setText(self.model.upx_dir)
+
+            # 更新模块选项
+            if self.model.hidden_imports:
+                self.hidden_imports_edit.setText(','.join(self.model.hidden_imports))
+            self.exclude_modules_edit.setText(self.model.exclude_module)
+            self.paths_edit.setText(self.model.paths)
+
+            # 更新附加参数
+            self.additional_args_edit.setPlainText(self.model.additional_args)
+        finally:
+            for blocker in blockers:
+                blocker.unblock()
+        self.config_changed.emit()
@@ -8,7 +8,7 @@ from PyQt5.QtWidgets import (
     QLabel, QLineEdit, QPushButton, QFileDialog, QCheckBox,
     QRadioButton, QButtonGroup, QMessageBox, QListWidget
 )
-from PyQt5.QtCore import pyqtSignal, pyqtSlot
+from PyQt5.QtCore import QSignalBlocker, pyqtSignal, pyqtSlot
 from PyQt5.QtGui import QFont
 
 from config.app_config import AppConfig
@@ -163,36 +163,43 @@ class BasicTab(QWidget):
     def browse_script(self) -> None:
         """浏览脚本文件"""
         file_path, _ = QFileDialog.getOpenFileName(
-            self, "选择Python脚本", "", "Python文件 (*.py);;所有文件 (*)"
+            self, "选择Python脚本", self.config.get_last_dir("script"), "Python文件 (*.py);;所有文件 (*)"
         )
         if file_path:
+            self.config.set_last_dir("script", os.path.dirname(file_path))
             self.script_path_edit.setText(file_path)
     
     @pyqtSlot()
     def browse_icon(self) -> None:
         """浏览图标文件"""
         file_path, _ = QFileDialog.getOpenFileName(
-            self, "选择图标文件", "", "图标文件 (*.ico *.png);;所有文件 (*)"
+            self, "选择图标文件", self.config.get_last_dir("icon"), "图标文件 (*.ico *.png);;所有文件 (*)"
         )
         if file_path:
+            self.config.set_last_dir("icon", os.path.dirname(file_path))
             self.icon_path_edit.setText(file_path)
     
     @pyqtSlot()
     def add_file(self) -> None:
         """添加文件"""
         file_path, _ = QFileDialog.getOpenFileName(
-            self, "选择要添加的文件", "", "所有文件 (*)"
+            self, "选择要添加的文件", self.config.get_last_dir("data"), "所有文件 (*)"
         )
         if file_path:
+            self.config.set_last_dir("data", os.path.dirname(file_path))
+            # 列表中文件条目排在目录条目之前，行号与模型列表下标一一对应
+            self.files_list.insertItem(len(self.model.additional_files), f"文件: {file_path}")
             self.model.additional_files.append(file_path)
-            self.files_list.addItem(f"文件: {file_path}")
             self.config_changed.emit()
     
     @pyqtSlot()
     def add_directory(self) -> None:
         """添加目录"""
-        dir_path = QFileDialog.getExistingDirectory(self, "选择要添加的目录")
+        dir_path = QFileDialog.getExistingDirectory(
+            self, "选择要添加的目录", self.config.get_last_dir("data")
+        )
         if dir_path:
+            self.config.set_last_dir("data", os.path.dirname(dir_path))
             self.model.additional_dirs.append(dir_path)
             self.files_list.addItem(f"目录: {dir_path}")
             self.config_changed.emit()
@@ -204,15 +211,12 @@ class BasicTab(QWidget):
         if current_row >= 0:
             item = self.files_list.takeItem(current_row)
             if item:
-                text = item.text()
-                if text.startswith("文件: "):
-                    file_path = text[4:]  # 移除"文件: "前缀
-                    if file_path in self.model.additional_files:
-                        self.model.additional_files.remove(file_path)
-                elif text.startswith("目录: "):
-                    dir_path = text[4:]  # 移除"目录: "前缀
-                    if dir_path in self.model.additional_dirs:
-                        self.model.additional_dirs.remove(dir_path)
+                # 前面的行对应附加文件，其余行按顺序对应附加目录，按下标直接删除
+                file_count = len(self.model.additional_files)
+                if current_row < file_count:
+                    del self.model.additional_files[current_row]
+                elif current_row - file_count < len(self.model.additional_dirs):
+                    del self.model.additional_dirs[current_row - file_count]
                 self.config_changed.emit()
     
     @pyqtSlot(str)
@@ -245,11 +249,18 @@ class BasicTab(QWidget):
     
     def refresh_ui(self) -> None:
         """刷新界面"""
-        # 更新脚本路径
-        self.script_path_edit.setText(self.model.script_path)
-        
-        # 更新图标路径
-        self.icon_path_edit.setText(self.model.icon_path)
+        # 路径来自模型，屏蔽变更信号避免逐个写回模型，结束后只发一次配置变更
+        script_changed = self.script_path_edit.text() != self.model.script_path
+        blockers = [QSignalBlocker(self.script_path_edit), QSignalBlocker(self.icon_path_edit)]
+        try:
+            # 更新脚本路径
+            self.script_path_edit.setText(self.model.script_path)
+
+            # 更新图标路径
+            self.icon_path_edit.setText(self.model.icon_path)
+        finally:
+            for blocker in blockers:
+                blocker.unblock()
         
         # 更新打包类型
         if self.model.is_one_file:
@@ -263,9 +274,21 @@ class BasicTab(QWidget):
         else:
             self.console_radio.setChecked(True)
         
-        # 更新文件列表
-        self.files_list.clear()
-        for file_path in self.model.additional_files:
-            self.files_list.addItem(f"文件: {file_path}")
-        for dir_path in self.model.additional_dirs:
-            self.files_list.addItem(f"目录: {dir_path}")
+        # 更新文件列表（一次性添加全部条目）
+        items = [f"文件: {file_path}" for file_path in self.model.additional_files]
+        items += [f"目录: {dir_path}" for dir_path in self.model.additional_dirs]
+        self.files_list.setUpdatesEnabled(False)
+        blocker = QSignalBlocker(self.files_list)
+        try:
+            self.files_list.clear()
+            self.files_list.addItems(items)
+        finally:
+            blocker.unblock()
+            self.files_list.setUpdatesEnabled(True)
+
+        self.config_changed.emit()
+
+        # 信号被屏蔽时 on_script_path_changed 不会执行，脚本变化时补发脚本选择信号
+        script_path = self.model.script_path
+        if script_changed and script_path and os.path.exists(script_path) and script_path.lower().endswith('.py'):
+            self.script_selected.emit(script_path)
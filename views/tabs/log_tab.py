@@ -1,7 +1,7 @@
 """
 打包日志标签页
 """
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QTextEdit, QPushButton, 
@@ -145,6 +145,21 @@ class LogTab(QWidget):
         if self.auto_scroll_checkbox.isChecked():
             self.scroll_timer.start(100)  # 延迟100ms滚动，避免频繁滚动
     
+    def append_logs(self, messages: List[str]) -> None:
+        """批量添加日志消息（一次追加到文本框）"""
+        messages = [message for message in messages if message.strip()]
+        if not messages:
+            return
+        
+        if self.show_timestamp_checkbox.isChecked():
+            timestamp = datetime.now().strftime("%H:%M:%S")
+            messages = [f"[{timestamp}] {message}" for message in messages]
+        
+        self.log_text.append("\n".join(messages))
+        
+        if self.auto_scroll_checkbox.isChecked():
+            self.scroll_timer.start(100)
+    
     @pyqtSlot()
     def scroll_to_bottom(self) -> None:
         """滚动到底部"""
@@ -227,6 +242,17 @@ class LogTab(QWidget):
         self.set_progress_text("正在打包...")
         self.log_info("开始打包过程")
     
+    def reset_for_new_build(self, initial_message: str = "") -> None:
+        """开始新一次打包：清空日志、进入打包状态并写入首条日志，只重绘一次"""
+        self.setUpdatesEnabled(False)
+        try:
+            self.clear_log()
+            self.start_packaging_ui()
+            if initial_message:
+                self.append_log(initial_message)
+        finally:
+            self.setUpdatesEnabled(True)
+    
     def finish_packaging_ui(self, success: bool, message: str = "") -> None:
         """完成打包时的UI更新"""
         self.show_progress(False)
@@ -978,6 +978,29 @@ class ModuleTab(QWidget):
             return True
         return False
 
+    def add_hidden_imports(self, module_names: List[str]) -> int:
+        """批量添加隐藏导入模块，列表只刷新一次
+
+        Args:
+            module_names: 要添加的模块名列表
+
+        Returns:
+            int: 实际新增的模块数量
+        """
+        existing = set(self.model.hidden_imports)
+        added = 0
+        for module_name in module_names:
+            if not module_name or not module_name.strip():
+                continue
+            module_name = module_name.strip()
+            if module_name not in existing:
+                existing.add(module_name)
+                self.model.hidden_imports.append(module_name)
+                added += 1
+        if added:
+            self.refresh_hidden_imports_list()
+        return added
+
     @pyqtSlot()
     def add_manual_import(self) -> None:
         """手动添加隐藏导入"""
@@ -1037,8 +1060,7 @@ class ModuleTab(QWidget):
     def refresh_hidden_imports_list(self) -> None:
         """刷新隐藏导入列表"""
         self.hidden_imports_list.clear()
-        for module in self.model.hidden_imports:
-            self.hidden_imports_list.addItem(module)
+        self.hidden_imports_list.addItems(self.model.hidden_imports)
 
     # ==================== 环境管理相关方法 ====================
 